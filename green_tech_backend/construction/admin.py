@@ -99,6 +99,7 @@ class ProjectAdmin(admin.ModelAdmin):
         'budget_utilization', 'days_remaining'
     )
     inlines = [ProjectMilestoneInline]
+    actions = ['mark_completed']
     fieldsets = (
         (_('Basic Information'), {
             'fields': (
@@ -172,6 +173,11 @@ class ProjectAdmin(admin.ModelAdmin):
             return f"{abs(delta)} days overdue"
     days_remaining.short_description = _('Timeline')
     
+    @admin.action(description='Mark selected projects as completed')
+    def mark_completed(self, request, queryset):
+        completed = queryset.complete()
+        self.message_user(request, f"Successfully completed {completed} projects.")
+    
     def save_model(self, request, obj, form, change):
         if not obj.pk:  # New project
             obj.created_by = request.user
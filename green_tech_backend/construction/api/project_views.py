@@ -7,14 +7,22 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, SAFE_METHODS, IsAdminUser
 from rest_framework.exceptions import ValidationError, PermissionDenied, NotFound
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
+from rest_framework.renderers import BaseRenderer
+from rest_framework.settings import api_settings
+from rest_framework.utils import encoders
+
+import hashlib
+import json
 
 from django.db import transaction
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django.shortcuts import get_object_or_404
-from django.db.models import Q, F, Case, When, Value, IntegerField, Sum
+from django.db.models import Q, F, Case, When, Value, IntegerField, Sum, Exists, OuterRef, Subquery, Max, Count
 from django.db.models.functions import Coalesce
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
 
 from construction.models import (
     Project,
@@ -61,8 +69,93 @@ from construction.notifications import (
     notify_overdue_project_task,
     notify_project_chat_message,
 )
-from construction.tasks import build_project_tasks_ics, mark_overdue_tasks
-from construction.realtime import broadcast_project_message
+from construction.tasks import (
+    broadcast_project_message_task,
+    build_project_tasks_ics,
+    mark_overdue_tasks,
+)
+
+
+# Allowed status transitions, keyed by the current status.
+PROJECT_VALID_TRANSITIONS: dict[str, frozenset[str]] = {
+    ProjectStatus.DRAFT: frozenset({ProjectStatus.PLANNING, ProjectStatus.CANCELLED}),
+    ProjectStatus.PLANNING: frozenset({ProjectStatus.IN_PROGRESS, ProjectStatus.ON_HOLD, ProjectStatus.CANCELLED}),
+    ProjectStatus.IN_PROGRESS: frozenset({ProjectStatus.ON_HOLD, ProjectStatus.COMPLETED, ProjectStatus.CANCELLED}),
+    ProjectStatus.ON_HOLD: frozenset({ProjectStatus.IN_PROGRESS, ProjectStatus.CANCELLED}),
+    ProjectStatus.COMPLETED: frozenset(),
+    ProjectStatus.CANCELLED: frozenset(),
+}
+
+MILESTONE_VALID_TRANSITIONS: dict[str, frozenset[str]] = {
+    MilestoneStatus.NOT_STARTED: frozenset({MilestoneStatus.IN_PROGRESS, MilestoneStatus.CANCELLED}),
+    MilestoneStatus.IN_PROGRESS: frozenset({MilestoneStatus.COMPLETED, MilestoneStatus.ON_HOLD, MilestoneStatus.CANCELLED}),
+    MilestoneStatus.ON_HOLD: frozenset({MilestoneStatus.IN_PROGRESS, MilestoneStatus.CANCELLED}),
+    MilestoneStatus.COMPLETED: frozenset(),
+    MilestoneStatus.CANCELLED: frozenset(),
+}
+
+# Permission classes keep no per-request state, so each viewset shares these
+# instances instead of constructing new ones on every request.
+_TEAM_MEMBER = IsProjectTeamMember()
+_TEAM_MEMBER_PERMISSIONS = (IsAuthenticated(), _TEAM_MEMBER)
+_MANAGER_PERMISSIONS = (IsAuthenticated(), IsProjectManagerOrAdmin())
+_EDITOR_PERMISSIONS = (IsAuthenticated(), CanEditProject())
+_ADMIN_PERMISSIONS = (IsAuthenticated(), IsAdminUser())
+
+# Columns touched by the milestone status/progress actions.
+_MILESTONE_PROGRESS_FIELDS = [
+    'status', 'actual_start_date', 'actual_end_date', 'completion_percentage', 'updated_at',
+]
+
+# Ordinal position of each phase, used to reject backwards phase moves.
+_PHASE_ORDER = {phase: index for index, phase in enumerate(ProjectPhase)}
+
+# Related tables whose changes invalidate the cached project read endpoints,
+# as ``(model, timestamp field)`` pairs.
+_MILESTONE_FRESHNESS = ((ProjectMilestone, 'updated_at'),)
+_DASHBOARD_FRESHNESS = _MILESTONE_FRESHNESS + (
+    (ProjectDocument, 'updated_at'),
+    (ProjectUpdate, 'created_at'),
+    (ProjectTask, 'updated_at'),
+)
+
+
+def _project_freshness(project, relations):
+    """
+    Return ``(etag, last_modified)`` validators for a project and the given
+    related tables, computed in a single query.
+    """
+    annotations = {}
+    for index, (model, field) in enumerate(relations):
+        rows = model.objects.filter(project=OuterRef('pk')).order_by().values('project')
+        annotations[f'latest_{index}'] = Subquery(rows.annotate(value=Max(field)).values('value')[:1])
+        annotations[f'count_{index}'] = Subquery(rows.annotate(value=Count('pk')).values('value')[:1])
+    stamps = (
+        Project.objects.filter(pk=project.pk)
+        .annotate(**annotations)
+        .values_list('updated_at', *annotations)
+        .first()
+    ) or (project.updated_at,)
+
+    digest = hashlib.md5(repr((project.pk,) + tuple(stamps)).encode()).hexdigest()
+    timestamps = [value for value in stamps if hasattr(value, 'timestamp')]
+    last_modified = int(max(timestamps).timestamp()) if timestamps else None
+    return quote_etag(digest), last_modified
+
+
+def _contractor_membership(user, project_ref):
+    """Return the contractor join rows linking ``user`` to ``project_ref``."""
+    return Project.contractors.through.objects.filter(project_id=project_ref, user_id=user.pk)
+
+
+def _team_member_q(user):
+    """Filter matching projects where ``user`` is on the project team."""
+    return (
+        Q(project_manager=user) |
+        Q(site_supervisor=user) |
+        Exists(_contractor_membership(user, OuterRef('pk'))) |
+        Q(construction_request__client=user)
+    )
 
 
 class ProjectViewSet(viewsets.ModelViewSet):
@@ -86,23 +179,26 @@ class ProjectViewSet(viewsets.ModelViewSet):
             return ProjectPhaseUpdateSerializer
         return ProjectSerializer
 
+    action_permissions = {
+        'list': _TEAM_MEMBER_PERMISSIONS,
+        'retrieve': _TEAM_MEMBER_PERMISSIONS,
+        'create': _MANAGER_PERMISSIONS,
+        'update': _EDITOR_PERMISSIONS,
+        'partial_update': _EDITOR_PERMISSIONS,
+        'destroy': _EDITOR_PERMISSIONS,
+        'update_status': _MANAGER_PERMISSIONS,
+        'update_phase': _MANAGER_PERMISSIONS,
+        'dashboard': _TEAM_MEMBER_PERMISSIONS,
+        'timeline': _TEAM_MEMBER_PERMISSIONS,
+        'get_timeline': _TEAM_MEMBER_PERMISSIONS,
+        'budget': _TEAM_MEMBER_PERMISSIONS,
+    }
+
     def get_permissions(self):
         """
-        Instantiates and returns the list of permissions that this view requires.
+        Return the shared permission instances this action requires.
         """
-        if self.action in ['list', 'retrieve']:
-            permission_classes = [IsAuthenticated, IsProjectTeamMember]
-        elif self.action in ['create']:
-            permission_classes = [IsAuthenticated, IsProjectManagerOrAdmin]
-        elif self.action in ['update', 'partial_update', 'destroy']:
-            permission_classes = [IsAuthenticated, CanEditProject]
-        elif self.action in ['update_status', 'update_phase']:
-            permission_classes = [IsAuthenticated, IsProjectManagerOrAdmin]
-        elif self.action in ['dashboard', 'timeline', 'get_timeline', 'budget']:
-            permission_classes = [IsAuthenticated, IsProjectTeamMember]
-        else:
-            permission_classes = [IsAuthenticated, IsAdminUser]
-        return [permission() for permission in permission_classes]
+        return self.action_permissions.get(self.action, _ADMIN_PERMISSIONS)
 
     def get_queryset(self):
         """
@@ -111,14 +207,10 @@ class ProjectViewSet(viewsets.ModelViewSet):
         user = self.request.user
         queryset = super().get_queryset()
 
-        # For non-admin users, only show projects they're associated with
+        # For non-admin users, only show projects they're associated with.
+        # Contractor membership is an EXISTS probe so no DISTINCT is needed.
         if not user.is_staff and not user.is_superuser:
-            queryset = queryset.filter(
-                Q(project_manager=user) |
-                Q(site_supervisor=user) |
-                Q(contractors=user) |
-                Q(construction_request__client=user)
-            ).distinct()
+            queryset = queryset.filter(_team_member_q(user))
 
         # Filter by status if provided
         status_param = self.request.query_params.get('status', None)
@@ -130,6 +222,8 @@ class ProjectViewSet(viewsets.ModelViewSet):
         if phase_param:
             queryset = queryset.filter(current_phase=phase_param)
 
+        if self.action in ('list', 'retrieve'):
+            queryset = queryset.with_related().with_metrics()
         return queryset
 
     @action(detail=True, methods=['post'])
@@ -144,17 +238,8 @@ class ProjectViewSet(viewsets.ModelViewSet):
             new_status = serializer.validated_data['status']
             
             # Validate status transition
-            valid_transitions = {
-                ProjectStatus.DRAFT: [ProjectStatus.PLANNING, ProjectStatus.CANCELLED],
-                ProjectStatus.PLANNING: [ProjectStatus.IN_PROGRESS, ProjectStatus.ON_HOLD, ProjectStatus.CANCELLED],
-                ProjectStatus.IN_PROGRESS: [ProjectStatus.ON_HOLD, ProjectStatus.COMPLETED, ProjectStatus.CANCELLED],
-                ProjectStatus.ON_HOLD: [ProjectStatus.IN_PROGRESS, ProjectStatus.CANCELLED],
-                ProjectStatus.COMPLETED: [],
-                ProjectStatus.CANCELLED: []
-            }
-            
             current_status = project.status
-            if new_status not in valid_transitions.get(current_status, []):
+            if new_status not in PROJECT_VALID_TRANSITIONS.get(current_status, frozenset()):
                 return Response(
                     {"status": f"Invalid status transition from {current_status} to {new_status}"},
                     status=status.HTTP_400_BAD_REQUEST
@@ -181,10 +266,9 @@ class ProjectViewSet(viewsets.ModelViewSet):
             new_phase = serializer.validated_data['current_phase']
             
             # Validate phase transition
-            valid_phases = list(ProjectPhase)
             current_phase = project.current_phase
             
-            if valid_phases.index(new_phase) < valid_phases.index(current_phase) and not request.user.is_superuser:
+            if _PHASE_ORDER[new_phase] < _PHASE_ORDER[current_phase] and not request.user.is_superuser:
                 return Response(
                     {"error": "Cannot move to a previous phase without admin approval"},
                     status=status.HTTP_400_BAD_REQUEST
@@ -218,6 +302,11 @@ class ProjectViewSet(viewsets.ModelViewSet):
         
         # Check if the user has permission to view this project
         self.check_object_permissions(self.request, project)
+
+        validators = _project_freshness(project, _DASHBOARD_FRESHNESS)
+        not_modified = self._not_modified(request, *validators)
+        if not_modified is not None:
+            return not_modified
         
         # Prefetch related data to optimize queries
         project = (
@@ -239,7 +328,7 @@ class ProjectViewSet(viewsets.ModelViewSet):
         )
 
         serializer = ProjectDashboardSerializer(instance=project, context={'request': request})
-        return Response(serializer.data)
+        return self._with_validators(Response(serializer.data), *validators)
 
     @action(detail=True, methods=['get'], url_path='timeline')
     def get_timeline(self, request, pk=None):
@@ -247,6 +336,11 @@ class ProjectViewSet(viewsets.ModelViewSet):
         Get project timeline data including milestones and key dates.
         """
         project = self.get_object()
+        validators = _project_freshness(project, _MILESTONE_FRESHNESS)
+        not_modified = self._not_modified(request, *validators)
+        if not_modified is not None:
+            return not_modified
+
         milestones = project.milestones.all().order_by('planned_start_date')
         serializer = ProjectMilestoneSerializer(milestones, many=True)
         
@@ -263,7 +357,7 @@ class ProjectViewSet(viewsets.ModelViewSet):
             'milestones': serializer.data
         }
         
-        return Response(timeline_data)
+        return self._with_validators(Response(timeline_data), *validators)
 
     @action(detail=True, methods=['get'])
     def budget(self, request, pk=None):
@@ -271,6 +365,10 @@ class ProjectViewSet(viewsets.ModelViewSet):
         Get project budget details and spending.
         """
         project = self.get_object()
+        validators = _project_freshness(project, _MILESTONE_FRESHNESS)
+        not_modified = self._not_modified(request, *validators)
+        if not_modified is not None:
+            return not_modified
         
         # Calculate budget utilization
         total_budget = project.budget or 0
@@ -294,19 +392,70 @@ class ProjectViewSet(viewsets.ModelViewSet):
             'by_phase': budget_by_phase
         }
         
-        return Response(budget_data)
+        return self._with_validators(Response(budget_data), *validators)
+
+    @staticmethod
+    def _not_modified(request, etag, last_modified):
+        """Return a 304 response when the client's cached copy is still current."""
+        return get_conditional_response(request, etag=etag, last_modified=last_modified)
+
+    @staticmethod
+    def _with_validators(response, etag, last_modified):
+        response['ETag'] = etag
+        if last_modified is not None:
+            response['Last-Modified'] = http_date(last_modified)
+        return response
 
 
 
-class ProjectDocumentViewSet(viewsets.ModelViewSet):
-    serializer_class = ProjectDocumentSerializer
-    permission_classes = [IsAuthenticated, IsProjectTeamMember]
-    parser_classes = [MultiPartParser, FormParser, JSONParser]
+class ProjectScopedViewSetMixin:
+    """
+    Shared plumbing for viewsets nested under ``projects/<project_pk>/``.
+
+    The parent project is loaded and permission-checked once per request.
+    Child objects are fetched from that project's queryset, so
+    IsProjectTeamMember would resolve them to the same project and reach the
+    same verdict; the repeated check (and its lazy ``obj.project`` load) is
+    skipped.
+    """
+
+    def get_permissions(self):
+        return _TEAM_MEMBER_PERMISSIONS
 
     def get_project(self):
-        project = get_object_or_404(Project, pk=self.kwargs['project_pk'])
-        self.check_object_permissions(self.request, project)
-        return project
+        if not hasattr(self, '_project_cache'):
+            project = get_object_or_404(Project, pk=self.kwargs['project_pk'])
+            self.check_object_permissions(self.request, project)
+            self._project_cache = project
+        return self._project_cache
+
+    def user_is_admin(self) -> bool:
+        """Staff/superuser flag for the requesting user, resolved once per request."""
+        if not hasattr(self, '_user_is_admin'):
+            user = self.request.user
+            self._user_is_admin = bool(user.is_staff or user.is_superuser)
+        return self._user_is_admin
+
+    def user_manages_project(self) -> bool:
+        """Whether the requesting user is staff or the project's manager."""
+        if not hasattr(self, '_user_manages_project'):
+            self._user_manages_project = bool(
+                self.request.user.is_staff
+                or self.get_project().project_manager_id == self.request.user.id
+            )
+        return self._user_manages_project
+
+    def check_object_permissions(self, request, obj):
+        project = getattr(self, '_project_cache', None)
+        if project is not None and getattr(obj, 'project_id', None) == project.pk:
+            obj.project = project
+            return
+        super().check_object_permissions(request, obj)
+
+
+class ProjectDocumentViewSet(ProjectScopedViewSetMixin, viewsets.ModelViewSet):
+    serializer_class = ProjectDocumentSerializer
+    parser_classes = [MultiPartParser, FormParser, JSONParser]
 
     def get_queryset(self):
         project = self.get_project()
@@ -324,14 +473,12 @@ class ProjectDocumentViewSet(viewsets.ModelViewSet):
         serializer.save(project=project, created_by=self.request.user)
 
     def perform_update(self, serializer):
-        project = self.get_project()
-        if not (self.request.user.is_staff or project.project_manager_id == self.request.user.id):
+        if not self.user_manages_project():
             raise PermissionDenied('Only the project manager can modify documents.')
         serializer.save()
 
     def perform_destroy(self, instance):
-        project = self.get_project()
-        if not (self.request.user.is_staff or project.project_manager_id == self.request.user.id):
+        if not self.user_manages_project():
             raise PermissionDenied('Only the project manager can remove documents.')
         instance.delete()
 
@@ -358,46 +505,30 @@ class ProjectDocumentViewSet(viewsets.ModelViewSet):
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
 
-class ProjectUpdateViewSet(viewsets.ModelViewSet):
+class ProjectUpdateViewSet(ProjectScopedViewSetMixin, viewsets.ModelViewSet):
     serializer_class = ProjectUpdateSerializer
-    permission_classes = [IsAuthenticated, IsProjectTeamMember]
-
-    def get_project(self):
-        project = get_object_or_404(Project, pk=self.kwargs['project_pk'])
-        self.check_object_permissions(self.request, project)
-        return project
 
     def get_queryset(self):
         project = self.get_project()
         queryset = project.updates.all().order_by('-created_at')
-        user = self.request.user
-        if self.request.method in SAFE_METHODS and not (user.is_staff or user.is_superuser):
+        if self.request.method in SAFE_METHODS and not self.user_is_admin():
             queryset = queryset.filter(is_customer_visible=True)
         return queryset
 
     def perform_create(self, serializer):
         project = self.get_project()
-        if not (self.request.user.is_staff or project.project_manager_id == self.request.user.id):
+        if not self.user_manages_project():
             raise PermissionDenied('Only the project manager can post updates.')
         serializer.save(project=project, created_by=self.request.user)
 
     def perform_update(self, serializer):
-        project = self.get_project()
-        if not (self.request.user.is_staff or project.project_manager_id == self.request.user.id):
+        if not self.user_manages_project():
             raise PermissionDenied('Only the project manager can modify updates.')
         serializer.save()
 
 
-class ProjectTaskViewSet(viewsets.ModelViewSet):
+class ProjectTaskViewSet(ProjectScopedViewSetMixin, viewsets.ModelViewSet):
     serializer_class = ProjectTaskSerializer
-    permission_classes = [IsAuthenticated, IsProjectTeamMember]
-
-    def get_project(self):
-        if not hasattr(self, '_project_cache'):
-            project = get_object_or_404(Project, pk=self.kwargs['project_pk'])
-            self.check_object_permissions(self.request, project)
-            self._project_cache = project
-        return self._project_cache
 
     def get_serializer_class(self):
         if self.action in {'create', 'update', 'partial_update'}:
@@ -413,13 +544,13 @@ class ProjectTaskViewSet(viewsets.ModelViewSet):
         project = self.get_project()
         queryset = project.tasks.all().order_by('due_date', '-created_at')
         user = self.request.user
-        if self.request.method in SAFE_METHODS and not (user.is_staff or user.is_superuser):
+        if self.request.method in SAFE_METHODS and not self.user_is_admin():
             queryset = queryset.filter(Q(assigned_to=user) | Q(requires_customer_action=True))
         return queryset
 
     def perform_create(self, serializer):
         project = self.get_project()
-        if not (self.request.user.is_staff or project.project_manager_id == self.request.user.id):
+        if not self.user_manages_project():
             raise PermissionDenied('Only the project manager can create tasks.')
         serializer.save(project=project, created_by=self.request.user)
         self._trigger_overdue_notifications(project)
@@ -427,15 +558,14 @@ class ProjectTaskViewSet(viewsets.ModelViewSet):
     def perform_update(self, serializer):
         project = self.get_project()
         instance = serializer.instance
-        if not (self.request.user.is_staff or project.project_manager_id == self.request.user.id):
+        if not self.user_manages_project():
             if not (instance.assigned_to_id == self.request.user.id or instance.requires_customer_action):
                 raise PermissionDenied('You do not have permission to update this task.')
         serializer.save()
         self._trigger_overdue_notifications(project)
 
     def perform_destroy(self, instance):
-        project = self.get_project()
-        if not (self.request.user.is_staff or project.project_manager_id == self.request.user.id):
+        if not self.user_manages_project():
             raise PermissionDenied('Only the project manager can remove tasks.')
         instance.delete()
 
@@ -501,21 +631,24 @@ class ProjectMilestoneViewSet(viewsets.ModelViewSet):
             return MilestoneStatusUpdateSerializer
         return ProjectMilestoneSerializer
 
+    action_permissions = {
+        'list': _TEAM_MEMBER_PERMISSIONS,
+        'retrieve': _TEAM_MEMBER_PERMISSIONS,
+        'create': _MANAGER_PERMISSIONS,
+        'update': _EDITOR_PERMISSIONS,
+        'partial_update': _EDITOR_PERMISSIONS,
+        'destroy': _EDITOR_PERMISSIONS,
+        'update_status': _TEAM_MEMBER_PERMISSIONS,
+        'add_dependency': _TEAM_MEMBER_PERMISSIONS,
+        'remove_dependency': _TEAM_MEMBER_PERMISSIONS,
+        'update_progress': _TEAM_MEMBER_PERMISSIONS,
+    }
+
     def get_permissions(self):
         """
-        Instantiates and returns the list of permissions that this view requires.
+        Return the shared permission instances this action requires.
         """
-        if self.action in ['list', 'retrieve']:
-            permission_classes = [IsAuthenticated, IsProjectTeamMember]
-        elif self.action in ['create']:
-            permission_classes = [IsAuthenticated, IsProjectManagerOrAdmin]
-        elif self.action in ['update', 'partial_update', 'destroy']:
-            permission_classes = [IsAuthenticated, CanEditProject]
-        elif self.action in ['update_status', 'add_dependency', 'remove_dependency', 'update_progress']:
-            permission_classes = [IsAuthenticated, IsProjectTeamMember]
-        else:
-            permission_classes = [IsAuthenticated, IsAdminUser]
-        return [permission() for permission in permission_classes]
+        return self.action_permissions.get(self.action, _ADMIN_PERMISSIONS)
 
     def get_queryset(self):
         """
@@ -528,16 +661,12 @@ class ProjectMilestoneViewSet(viewsets.ModelViewSet):
         if project_pk:
             queryset = queryset.filter(project_id=project_pk)
         
-        # For non-admin users, only show milestones for projects they're associated with
+        # For non-admin users, only show milestones for projects they're
+        # associated with, as a single semi-join against the visible projects.
         user = self.request.user
         if not user.is_staff and not user.is_superuser:
-            queryset = queryset.filter(
-                Q(project__project_manager=user) |
-                Q(project__supervisor=user) |
-                Q(project__contractors=user) |
-                Q(project__project_owner=user) |
-                Q(assigned_to=user)
-            ).distinct()
+            user_projects = Project.objects.filter(_team_member_q(user)).values('pk')
+            queryset = queryset.filter(project__in=Subquery(user_projects))
         
         # Filter by status if provided
         status_param = self.request.query_params.get('status', None)
@@ -549,6 +678,8 @@ class ProjectMilestoneViewSet(viewsets.ModelViewSet):
         if phase_param:
             queryset = queryset.filter(phase=phase_param)
             
+        if self.action in ('list', 'retrieve'):
+            queryset = queryset.with_related()
         return queryset
 
     def perform_create(self, serializer):
@@ -574,16 +705,8 @@ class ProjectMilestoneViewSet(viewsets.ModelViewSet):
             new_status = serializer.validated_data['status']
             
             # Validate status transition
-            valid_transitions = {
-                MilestoneStatus.NOT_STARTED: [MilestoneStatus.IN_PROGRESS, MilestoneStatus.CANCELLED],
-                MilestoneStatus.IN_PROGRESS: [MilestoneStatus.COMPLETED, MilestoneStatus.ON_HOLD, MilestoneStatus.CANCELLED],
-                MilestoneStatus.ON_HOLD: [MilestoneStatus.IN_PROGRESS, MilestoneStatus.CANCELLED],
-                MilestoneStatus.COMPLETED: [],
-                MilestoneStatus.CANCELLED: []
-            }
-            
             current_status = milestone.status
-            if new_status not in valid_transitions.get(current_status, []):
+            if new_status not in MILESTONE_VALID_TRANSITIONS.get(current_status, frozenset()):
                 return Response(
                     {"error": f"Invalid status transition from {current_status} to {new_status}"},
                     status=status.HTTP_400_BAD_REQUEST
@@ -599,10 +722,10 @@ class ProjectMilestoneViewSet(viewsets.ModelViewSet):
                 milestone.actual_end_date = now
                 milestone.completion_percentage = 100
             
-            milestone.save()
-            
-            # Update project progress
-            milestone.project.update_progress()
+            with transaction.atomic():
+                milestone.save(update_fields=_MILESTONE_PROGRESS_FIELDS)
+                # Update project progress
+                milestone.project.update_progress()
             
             return Response(
                 {"status": f"Milestone status updated to {new_status}"},
@@ -641,10 +764,10 @@ class ProjectMilestoneViewSet(viewsets.ModelViewSet):
             if not milestone.actual_start_date:
                 milestone.actual_start_date = timezone.now()
         
-        milestone.save()
-        
-        # Update project progress
-        milestone.project.update_progress()
+        with transaction.atomic():
+            milestone.save(update_fields=_MILESTONE_PROGRESS_FIELDS)
+            # Update project progress
+            milestone.project.update_progress()
         
         return Response(
             {"status": f"Milestone progress updated to {progress}%"},
@@ -666,7 +789,9 @@ class ProjectMilestoneViewSet(viewsets.ModelViewSet):
             )
         
         try:
-            dependency = ProjectMilestone.objects.get(pk=dependency_id, project_id=project_pk)
+            dependency = ProjectMilestone.objects.only('id', 'title').get(
+                pk=dependency_id, project_id=project_pk
+            )
             
             # Check for circular dependencies
             if self._has_circular_dependency(milestone, dependency):
@@ -675,7 +800,7 @@ class ProjectMilestoneViewSet(viewsets.ModelViewSet):
                     status=status.HTTP_400_BAD_REQUEST
                 )
             
-            milestone.dependencies.add(dependency)
+            milestone.depends_on.add(dependency)
             return Response(
                 {"status": f"Added dependency: {dependency.title}"},
                 status=status.HTTP_200_OK
@@ -702,8 +827,8 @@ class ProjectMilestoneViewSet(viewsets.ModelViewSet):
             )
         
         try:
-            dependency = milestone.dependencies.get(pk=dependency_id)
-            milestone.dependencies.remove(dependency)
+            dependency = milestone.depends_on.only('id', 'title').get(pk=dependency_id)
+            milestone.depends_on.remove(dependency)
             return Response(
                 {"status": f"Removed dependency: {dependency.title}"},
                 status=status.HTTP_200_OK
@@ -722,27 +847,27 @@ class ProjectMilestoneViewSet(viewsets.ModelViewSet):
         if milestone == dependency:
             return True
 
-        # Check if the dependency already depends on the milestone
-        visited = set()
-        to_visit = [dependency]
-
-        while to_visit:
-            current = to_visit.pop()
+        # Check if the dependency already depends on the milestone, walking the
+        # whole dependency tree in one recursive query
+        return ProjectMilestone.objects.dependencies_of(dependency).filter(pk=milestone.pk).exists()
 
-            # If we've already visited this milestone, skip it
-            if current.id in visited:
-                continue
 
-            # If we find the original milestone in the dependency tree, it's a circular reference
-            if current == milestone:
-                return True
+class NDJSONRenderer(BaseRenderer):
+    """Render a list payload as newline-delimited JSON."""
 
-            visited.add(current.id)
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
 
-            # Add all dependencies of the current milestone to the queue
-            to_visit.extend(current.dependencies.all())
+    @staticmethod
+    def render_line(item) -> bytes:
+        return json.dumps(item, cls=encoders.JSONEncoder).encode() + b'\n'
 
-        return False
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if isinstance(data, dict):
+            data = [data]
+        return b''.join(self.render_line(item) for item in data)
 
 
 class ProjectChatMessageViewSet(
@@ -754,6 +879,8 @@ class ProjectChatMessageViewSet(
 
     serializer_class = ProjectMessageSerializer
     permission_classes = (IsAuthenticated,)
+    renderer_classes = [*api_settings.DEFAULT_RENDERER_CLASSES, NDJSONRenderer]
+    stream_chunk_size = 200
 
     def _project_queryset(self):
         return Project.objects.select_related(
@@ -769,8 +896,7 @@ class ProjectChatMessageViewSet(
         )
 
     def _ensure_access(self, project: Project, *, write: bool = False) -> None:
-        perm = IsProjectTeamMember()
-        if not perm._is_team_member(self.request.user, project):
+        if not _TEAM_MEMBER._is_team_member(self.request.user, project):
             raise PermissionDenied('You do not have access to this project chat.')
         if write:
             # Team members (including customers) may post messages once access is granted.
@@ -787,25 +913,58 @@ class ProjectChatMessageViewSet(
         project = self.get_project()
         return self._message_queryset().filter(project=project).order_by('created_at')
 
+    def list(self, request, *args, **kwargs):
+        if request.accepted_renderer.format != NDJSONRenderer.format:
+            return super().list(request, *args, **kwargs)
+        # Firehose export: stream every message in chunks instead of
+        # materializing a page, so memory stays bounded by the chunk size.
+        queryset = self.filter_queryset(self.get_queryset())
+        return StreamingHttpResponse(
+            self._stream_messages(queryset),
+            content_type=NDJSONRenderer.media_type,
+        )
+
+    def _stream_messages(self, queryset):
+        context = self.get_serializer_context()
+        for message in queryset.iterator(chunk_size=self.stream_chunk_size):
+            data = self.get_serializer_class()(message, context=context).data
+            yield NDJSONRenderer.render_line(data)
+
     def perform_create(self, serializer):
         project = self.get_project()
         self._ensure_access(project, write=True)
         user = self.request.user
-        message = serializer.save(project=project, sender=user)
-        ProjectMessageReceipt.objects.update_or_create(
-            message=message,
-            user=user,
-            defaults={'read_at': timezone.now()},
-        )
-        broadcast_project_message(message)
+        with transaction.atomic():
+            message = serializer.save(project=project, sender=user)
+            receipt, _created = ProjectMessageReceipt.objects.update_or_create(
+                message=message,
+                user=user,
+                defaults={'read_at': timezone.now()},
+            )
+            # Push to websocket subscribers once the transaction commits so
+            # the channel-layer round trip stays off the request thread.
+            transaction.on_commit(
+                lambda message_id=str(message.pk): broadcast_project_message_task.delay(message_id)
+            )
+        # A freshly created message has no attachments (they are read-only on
+        # the serializer) and exactly one receipt, so prime the prefetch cache
+        # instead of re-querying the message for serialization.
+        self._prime_prefetch_cache(message, 'attachments', [])
+        self._prime_prefetch_cache(message, 'receipts', [receipt])
         notify_project_chat_message(message)
         return message
 
+    @staticmethod
+    def _prime_prefetch_cache(instance, name, objects) -> None:
+        queryset = getattr(instance, name).all()
+        queryset._result_cache = list(objects)
+        queryset._prefetch_done = True
+        instance.__dict__.setdefault('_prefetched_objects_cache', {})[name] = queryset
+
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         message = self.perform_create(serializer)
-        message = self._message_queryset().get(pk=message.pk)
         output = self.get_serializer(message)
         headers = self.get_success_headers(output.data)
         return Response(output.data, status=status.HTTP_201_CREATED, headers=headers)
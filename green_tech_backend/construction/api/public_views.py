@@ -1,15 +1,89 @@
 """
 Public API views for frontend display without authentication.
 """
+import hashlib
+
 from rest_framework import viewsets, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from django.db.models import Q
+from django.core.cache import cache
+from django.db.models import Count, Max, Q
+from django.utils.cache import get_conditional_response
+from django.utils.decorators import method_decorator
+from django.utils.http import http_date, quote_etag
+from django.views.decorators.gzip import gzip_page
+from django.views.decorators.vary import vary_on_headers
 
+from construction.cache import PUBLIC_STATS_CACHE_TIMEOUT, public_stats_cache_key
 from construction.models import Project, ProjectStatus
 from construction.serializers.public_serializers import PublicProjectSerializer
 
 
+CATEGORY_KEYWORDS = {
+    'residential': ('house', 'home', 'residential'),
+    'commercial': ('office', 'commercial', 'shop'),
+    'industrial': ('factory', 'industrial', 'warehouse'),
+}
+
+
+def _keyword_q(keywords):
+    """
+    OR together title/description matches for ``keywords``.
+
+    On PostgreSQL these lookups are served by the pg_trgm GIN indexes added in
+    migration 0004 rather than a sequential scan.
+    """
+    condition = Q()
+    for keyword in keywords:
+        condition |= Q(title__icontains=keyword) | Q(description__icontains=keyword)
+    return condition
+
+
+# Projects don't carry a category field yet, so categories are keyword matches
+# built once at import time instead of on every request.
+CATEGORY_FILTERS = {
+    category: _keyword_q(keywords) for category, keywords in CATEGORY_KEYWORDS.items()
+}
+
+
+# Columns PublicProjectSerializer reads (including its category/location
+# helpers); everything else on Project and the joined rows stays unselected.
+PUBLIC_PROJECT_FIELDS = (
+    'id',
+    'title',
+    'description',
+    'status',
+    'planned_start_date',
+    'actual_start_date',
+    'actual_end_date',
+    'created_at',
+    'updated_at',
+    'construction_request',
+    'construction_request__city',
+    'construction_request__region',
+    'construction_request__property',
+    'construction_request__property__property_type',
+)
+
+
+def _validators(*parts, last_modified=None):
+    """Build ``(etag, last_modified)`` from the values the payload depends on."""
+    digest = hashlib.md5(repr(parts).encode()).hexdigest()
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    return quote_etag(digest), timestamp
+
+
+def _queryset_validators(queryset, *parts):
+    """
+    Validators for a project collection: the newest ``updated_at`` plus the row
+    count (so deletions and filter changes also produce a new ETag).
+    """
+    stamps = queryset.order_by().aggregate(latest=Max('updated_at'), total=Count('pk'))
+    return _validators(stamps['latest'], stamps['total'], *parts, last_modified=stamps['latest'])
+
+
+@method_decorator(gzip_page, name='dispatch')
+@method_decorator(vary_on_headers('Accept', 'Accept-Language'), name='dispatch')
 class PublicProjectViewSet(viewsets.ReadOnlyModelViewSet):
     """
     Public API endpoint for displaying projects on the frontend website.
@@ -39,38 +113,33 @@ class PublicProjectViewSet(viewsets.ReadOnlyModelViewSet):
         
         # Filter by category if provided
         category_param = self.request.query_params.get('category', None)
-        if category_param:
-            # For category filtering, we'll use a simple approach
-            # In a real implementation, you might want to add a category field to the Project model
-            if category_param == 'residential':
-                queryset = queryset.filter(
-                    Q(title__icontains='house') | 
-                    Q(title__icontains='home') | 
-                    Q(title__icontains='residential') |
-                    Q(description__icontains='house') | 
-                    Q(description__icontains='home') | 
-                    Q(description__icontains='residential')
-                )
-            elif category_param == 'commercial':
-                queryset = queryset.filter(
-                    Q(title__icontains='office') | 
-                    Q(title__icontains='commercial') | 
-                    Q(title__icontains='shop') |
-                    Q(description__icontains='office') | 
-                    Q(description__icontains='commercial') | 
-                    Q(description__icontains='shop')
-                )
-            elif category_param == 'industrial':
-                queryset = queryset.filter(
-                    Q(title__icontains='factory') | 
-                    Q(title__icontains='industrial') | 
-                    Q(title__icontains='warehouse') |
-                    Q(description__icontains='factory') | 
-                    Q(description__icontains='industrial') | 
-                    Q(description__icontains='warehouse')
-                )
+        category_filter = CATEGORY_FILTERS.get(category_param)
+        if category_filter is not None:
+            queryset = queryset.filter(category_filter)
         
-        return queryset.select_related('property').prefetch_related('contractors')
+        return queryset.select_related('construction_request__property').only(*PUBLIC_PROJECT_FIELDS)
+    
+    def list(self, request, *args, **kwargs):
+        # The full path covers search, ordering and page params.
+        validators = _queryset_validators(
+            self.filter_queryset(self.get_queryset()), request.get_full_path()
+        )
+        not_modified = self._not_modified(request, *validators)
+        if not_modified is not None:
+            return not_modified
+        if request.method == 'HEAD':
+            # HEAD only needs the validators; skip fetching and serializing the page.
+            return self._with_validators(Response(), *validators)
+        return self._with_validators(super().list(request, *args, **kwargs), *validators)
+    
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        validators = _validators(instance.pk, instance.updated_at, last_modified=instance.updated_at)
+        not_modified = self._not_modified(request, *validators)
+        if not_modified is not None:
+            return not_modified
+        serializer = self.get_serializer(instance)
+        return self._with_validators(Response(serializer.data), *validators)
     
     @action(detail=False, methods=['get'])
     def featured(self, request):
@@ -79,27 +148,51 @@ class PublicProjectViewSet(viewsets.ReadOnlyModelViewSet):
         Returns a limited number of high-quality projects.
         """
         # Get completed projects or projects in progress
-        featured_projects = self.get_queryset().filter(
+        candidates = self.get_queryset().filter(
             status__in=[ProjectStatus.COMPLETED, ProjectStatus.IN_PROGRESS]
-        ).order_by('-created_at')[:6]  # Limit to 6 featured projects
+        )
+        validators = _queryset_validators(candidates, request.get_full_path())
+        not_modified = self._not_modified(request, *validators)
+        if not_modified is not None:
+            return not_modified
         
+        featured_projects = candidates.order_by('-created_at')[:6]  # Limit to 6 featured projects
         serializer = self.get_serializer(featured_projects, many=True)
-        return Response(serializer.data)
+        return self._with_validators(Response(serializer.data), *validators)
     
     @action(detail=False, methods=['get'])
     def stats(self, request):
         """
         Get project statistics for the frontend.
         """
-        queryset = self.get_queryset()
-        
-        stats = {
-            'total_projects': queryset.count(),
-            'completed_projects': queryset.filter(status=ProjectStatus.COMPLETED).count(),
-            'ongoing_projects': queryset.filter(status=ProjectStatus.IN_PROGRESS).count(),
-            'countries_served': 15,  # This could be calculated from actual data
-            'total_area_developed': '1M+',  # This could be calculated from actual data
-            'client_satisfaction': 98  # This could be calculated from actual feedback
-        }
+        cache_key = public_stats_cache_key(
+            request.query_params.get('status'), request.query_params.get('category')
+        )
+        stats = cache.get(cache_key)
+        if stats is None:
+            counts = self.get_queryset().aggregate(
+                total_projects=Count('id'),
+                completed_projects=Count('id', filter=Q(status=ProjectStatus.COMPLETED)),
+                ongoing_projects=Count('id', filter=Q(status=ProjectStatus.IN_PROGRESS)),
+            )
+            stats = {
+                **counts,
+                'countries_served': 15,  # This could be calculated from actual data
+                'total_area_developed': '1M+',  # This could be calculated from actual data
+                'client_satisfaction': 98  # This could be calculated from actual feedback
+            }
+            cache.set(cache_key, stats, PUBLIC_STATS_CACHE_TIMEOUT)
         
         return Response(stats)
+    
+    @staticmethod
+    def _not_modified(request, etag, last_modified):
+        """Return a 304 response when the client's cached copy is still current."""
+        return get_conditional_response(request, etag=etag, last_modified=last_modified)
+    
+    @staticmethod
+    def _with_validators(response, etag, last_modified):
+        response['ETag'] = etag
+        if last_modified is not None:
+            response['Last-Modified'] = http_date(last_modified)
+        return response
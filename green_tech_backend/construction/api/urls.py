@@ -1,11 +1,13 @@
 """
 URL configuration for the construction app's API endpoints.
+
+This is the only construction URLconf; ``core.urls`` mounts it under
+``api/construction/``. Quote endpoints live in the quotes app.
 """
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter, SimpleRouter
 
 from .analytics_views import AgentAnalyticsDashboardView
-# Quote views now handled by quotes app
 
 # Import project views
 from .project_views import (
@@ -22,6 +24,7 @@ from .public_views import PublicProjectViewSet
 
 # Import API views
 from ..api_views import ConstructionRequestViewSet, EcoFeatureSelectionViewSet
+from ..ghana.views import GhanaPricingViewSet
 
 # Create a router and register our viewsets with it
 router = DefaultRouter()
@@ -30,6 +33,7 @@ router.register(r'construction-requests', ConstructionRequestViewSet,
                 basename='construction-request')
 router.register(r'eco-feature-selections', EcoFeatureSelectionViewSet, 
                 basename='eco-feature-selection')
+router.register(r'ghana/pricing', GhanaPricingViewSet, basename='ghana-pricing')
 
 # Project and Milestone endpoints
 router.register(r'projects', ProjectViewSet, basename='project')
@@ -50,14 +54,6 @@ project_router.register(r'tasks', ProjectTaskViewSet,
 project_router.register(r'chat-messages', ProjectChatMessageViewSet,
                        basename='project-chat-message')
 
-# Quote endpoints now handled by quotes app
-# quote_router = SimpleRouter()
-# quote_router.register(r'quotes', QuoteViewSet, basename='quote')
-
-# Nested router for quote items now handled by quotes app
-# quote_item_router = SimpleRouter()
-# quote_item_router.register(r'items', QuoteItemViewSet, basename='quote-item')
-
 # The API URLs are now determined automatically by the router
 urlpatterns = [
     path('analytics/agent-dashboard', AgentAnalyticsDashboardView.as_view(), name='agent-analytics-dashboard'),
@@ -66,10 +62,4 @@ urlpatterns = [
     
     # Project nested routes
     path('projects/<int:project_pk>/', include(project_router.urls)),
-    
-    # Quote URLs now handled by quotes app
-    # path('', include(quote_router.urls)),
-    
-    # Nested quote items URLs now handled by quotes app
-    # path('quotes/<uuid:quote_pk>/', include(quote_item_router.urls)),
 ]
@@ -1,10 +1,16 @@
 """
 API Views for Construction Request and Eco-Feature Selection
 """
+import os
+from collections import defaultdict
+from decimal import Decimal
+
 from rest_framework import viewsets, status, mixins
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
+from django.core.cache import cache
+from django.http import FileResponse, StreamingHttpResponse
 from django.utils.translation import gettext_lazy as _
 from django.db import transaction
 
@@ -12,12 +18,27 @@ from construction.models import (
     ConstructionRequest, ConstructionRequestEcoFeature,
     ConstructionRequestStep
 )
+from construction.models.request import COST_RECOMPUTE_TIMEOUT, cost_recompute_cache_key
 from construction.serializers import (
     ConstructionRequestSerializer, ConstructionRequestEcoFeatureSerializer
 )
-from construction.ghana.models import EcoFeature, GhanaRegion
+from construction.ghana.models import EcoFeature, GhanaPricing, GhanaRegion
+from construction.document_generator import generate_document_filename, specification_cache_key
 from construction.permissions import IsOwnerOrAdmin, CanEditConstructionRequest
 
+# Step labels stay lazy, so these can be built once at import time.
+_STEP_CHOICES = dict(ConstructionRequestStep.choices)
+_STEP_ORDER = list(_STEP_CHOICES)
+_STEP_INDEX = {step: index for index, step in enumerate(_STEP_ORDER)}
+
+SPEC_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _iter_chunks(payload, chunk_size=SPEC_STREAM_CHUNK_SIZE):
+    view = memoryview(payload)
+    for offset in range(0, len(view), chunk_size):
+        yield bytes(view[offset:offset + chunk_size])
+
 
 class ConstructionRequestViewSet(viewsets.ModelViewSet):
     """
@@ -26,6 +47,9 @@ class ConstructionRequestViewSet(viewsets.ModelViewSet):
     queryset = ConstructionRequest.objects.all()
     serializer_class = ConstructionRequestSerializer
     permission_classes = [IsAuthenticated, CanEditConstructionRequest]
+    # Actions that serialize requests as stored. Write actions change the
+    # related rows before responding, so prefetching there would go stale.
+    read_actions = frozenset({'list', 'retrieve'})
     
     def get_queryset(self):
         """Return construction requests for the authenticated user, filtered by status if provided."""
@@ -42,13 +66,27 @@ class ConstructionRequestViewSet(viewsets.ModelViewSet):
         status_param = self.request.query_params.get('status', None)
         if status_param:
             queryset = queryset.filter(status=status_param)
-            
+        
+        if self.action == 'generate_specification' and self._wants_async():
+            # Only the permission check and the task id are needed here; the
+            # task loads everything the PDF renders.
+            return queryset.only('id', 'client', 'project_manager')
+        if self.action in self.read_actions:
+            queryset = self.get_serializer_class().setup_eager_loading(queryset)
         return queryset
     
     def perform_create(self, serializer):
         """Set the client to the current user when creating a request."""
         serializer.save(client=self.request.user)
     
+    def perform_update(self, serializer):
+        """Re-price the selected eco-features when the request moves region."""
+        previous_region = serializer.instance.region
+        construction_request = serializer.save()
+        if construction_request.region != previous_region:
+            ConstructionRequestEcoFeature.recalculate_for_request(construction_request)
+            construction_request.update_estimated_cost()
+    
     @action(detail=True, methods=['post'])
     def save_step(self, request, pk=None):
         """Save data for a specific step in the construction request process."""
@@ -63,7 +101,7 @@ class ConstructionRequestViewSet(viewsets.ModelViewSet):
             )
         
         # Validate the step
-        if step not in dict(ConstructionRequestStep.choices):
+        if step not in _STEP_CHOICES:
             return Response(
                 {'error': _('Invalid step.')}, 
                 status=status.HTTP_400_BAD_REQUEST
@@ -87,34 +125,23 @@ class ConstructionRequestViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
     
     def _process_eco_features(self, construction_request, data):
-        """Process the selected eco-features for a construction request."""
+        """Queue the selected eco-features and cost refresh for a construction request.
+
+        The selections are applied and the estimate recalculated in the
+        background; the new estimate is pushed to the project channel. Until
+        the task finishes the request reports ``cost_status: 'recomputing'``,
+        so clients can poll it. When the task has already run (eager Celery)
+        the recomputed estimate is loaded straight away.
+        """
+        from construction.tasks import recompute_construction_cost
+
         selected_features = data.get('selected_features', [])
-        
-        # Clear existing selections
-        construction_request.selected_eco_features.all().delete()
-        
-        # Add new selections
-        for feature_data in selected_features:
-            feature_id = feature_data.get('id')
-            quantity = feature_data.get('quantity', 1)
-            customizations = feature_data.get('customizations', {})
-            
-            try:
-                eco_feature = EcoFeature.objects.get(id=feature_id)
-                
-                # Create the construction request eco feature
-                ConstructionRequestEcoFeature.objects.create(
-                    construction_request=construction_request,
-                    eco_feature=eco_feature,
-                    quantity=quantity,
-                    customizations=customizations
-                )
-                
-            except EcoFeature.DoesNotExist:
-                continue
-        
-        # Update the estimated cost
-        construction_request.update_estimated_cost()
+        cache.set(
+            cost_recompute_cache_key(construction_request.pk), True, COST_RECOMPUTE_TIMEOUT
+        )
+        result = recompute_construction_cost.delay(construction_request.pk, list(selected_features))
+        if result.ready():
+            construction_request.refresh_from_db(fields=['estimated_cost', 'updated_at'])
     
     @action(detail=True, methods=['get'])
     def next_steps(self, request, pk=None):
@@ -122,55 +149,86 @@ class ConstructionRequestViewSet(viewsets.ModelViewSet):
         construction_request = self.get_object()
         current_step = construction_request.current_step
         
-        # Get all steps
-        steps = dict(ConstructionRequestStep.choices)
-        step_list = list(steps.keys())
-        
         # Find the current step index
-        try:
-            current_index = step_list.index(current_step)
-            next_steps = step_list[current_index + 1:]
-        except (ValueError, IndexError):
-            next_steps = []
+        current_index = _STEP_INDEX.get(current_step)
+        next_steps = [] if current_index is None else _STEP_ORDER[current_index + 1:]
         
         return Response({
             'current_step': current_step,
             'next_steps': [
-                {'value': step, 'label': steps[step]} 
+                {'value': step, 'label': _STEP_CHOICES[step]} 
                 for step in next_steps
             ]
         })
     
+    def _wants_async(self):
+        return self.request.query_params.get('async') in ('1', 'true')
+    
     @action(detail=True, methods=['post'])
     def generate_specification(self, request, pk=None):
-        """Generate and return a PDF specification document for the construction request."""
-        from django.http import FileResponse
-        import os
-        from django.conf import settings
-        
+        """Generate and return a PDF specification document for the construction request.
+
+        With ``?async=1`` the PDF is rendered in the background instead: the
+        response is 202 with the task id, the finished document is announced
+        on the project channel and served by the ``specification`` action.
+        """
+        # get_queryset() already scopes non-staff users to their own requests
         construction_request = self.get_object()
         
-        # Check permissions
-        if not request.user.is_staff and construction_request.client != request.user:
+        if self._wants_async():
+            from construction.tasks import render_spec_pdf
+
+            result = render_spec_pdf.delay(construction_request.pk)
             return Response(
-                {'error': 'You do not have permission to generate documents for this request.'},
-                status=status.HTTP_403_FORBIDDEN
+                {'task_id': result.id, 'status': 'queued'},
+                status=status.HTTP_202_ACCEPTED
             )
         
         try:
-            # Generate the document
-            file_path, file_name = construction_request.generate_specification_document()
-            
-            # Return the file for download
-            response = FileResponse(open(file_path, 'rb'), content_type='application/pdf')
-            response['Content-Disposition'] = f'attachment; filename="{file_name}"'
-            return response
-            
+            document = construction_request.generate_specification_document()
         except Exception as e:
             return Response(
                 {'error': f'Failed to generate specification: {str(e)}'},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+        return self._specification_response(construction_request, document)
+
+    @action(detail=True, methods=['get'])
+    def specification(self, request, pk=None):
+        """Download the most recent PDF specification for the construction request."""
+        construction_request = self.get_object()
+        document = construction_request.documents.filter(
+            title__startswith='Specification - '
+        ).first()
+        response = self._specification_response(construction_request, document)
+        if response is None:
+            return Response(
+                {'error': _('No specification has been generated yet.')},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        return response
+
+    @staticmethod
+    def _specification_response(construction_request, document):
+        """Stream the specification PDF from the cache, else from ``document``'s file."""
+        # Serve a freshly rendered PDF straight from the cache, no file handle needed
+        pdf_bytes = cache.get(specification_cache_key(construction_request))
+        if pdf_bytes is not None:
+            response = StreamingHttpResponse(_iter_chunks(pdf_bytes), content_type='application/pdf')
+            response['Content-Length'] = len(pdf_bytes)
+            response['Content-Disposition'] = (
+                f'attachment; filename="{generate_document_filename(construction_request)}"'
+            )
+            return response
+        if document is None:
+            return None
+        # FileResponse closes the file with the response and lets the server use sendfile
+        return FileResponse(
+            document.file.open('rb'),
+            as_attachment=True,
+            filename=os.path.basename(document.file.name),
+            content_type='application/pdf',
+        )
 
 
 class EcoFeatureSelectionViewSet(
@@ -204,8 +262,6 @@ class EcoFeatureSelectionViewSet(
     @action(detail=False, methods=['get'])
     def by_category(self, request):
         """Get eco-features grouped by category."""
-        from construction.ghana.models import EcoFeatureCategory
-        
         request_id = request.query_params.get('request_id')
         if not request_id:
             return Response(
@@ -228,38 +284,50 @@ class EcoFeatureSelectionViewSet(
                 status=status.HTTP_403_FORBIDDEN
             )
         
-        # Get all categories with their features
+        # Load the catalogue, this request's selections and the regional prices
+        # once each, then group in Python instead of querying per category.
+        features_by_category = defaultdict(list)
+        for feature in EcoFeature.objects.only('id', 'name', 'description', 'category'):
+            features_by_category[feature.category].append(feature)
+        
+        # Selections come back as plain rows grouped by their feature's category;
+        # order_by() drops the default ordering join on eco_feature.
+        selected_by_category = defaultdict(dict)
+        selections = ConstructionRequestEcoFeature.objects.filter(
+            construction_request=construction_request
+        ).order_by().values(
+            'id', 'eco_feature_id', 'eco_feature__category',
+            'quantity', 'custom_specifications', 'estimated_cost'
+        )
+        for selection in selections:
+            selected_by_category[selection.pop('eco_feature__category')][
+                str(selection.pop('eco_feature_id'))
+            ] = selection
+        
+        base_costs = {}
+        region = construction_request.ghana_region
+        if region is not None:
+            for price in GhanaPricing.objects.filter(region=region, is_active=True):
+                price.region = region
+                base_costs[price.eco_feature_id] = price.get_adjusted_price()
+        
         categories = []
-        for category in EcoFeatureCategory.objects.all():
-            features = category.eco_features.all()
-            
-            # Get the selected features for this request
-            selected_features = {
-                str(feature.eco_feature_id): {
-                    'id': feature.id,
-                    'quantity': feature.quantity,
-                    'customizations': feature.customizations,
-                    'estimated_cost': feature.estimated_cost
-                }
-                for feature in construction_request.selected_eco_features.filter(
-                    eco_feature__category=category
-                )
-            }
-            
+        for category, label in EcoFeature.FeatureCategory.choices:
+            selected_features = selected_by_category.get(category, {})
             categories.append({
-                'id': str(category.id),
-                'name': category.name,
-                'description': category.description,
+                'id': category,
+                'name': str(label),
+                'description': '',
                 'features': [
                     {
                         'id': str(feature.id),
                         'name': feature.name,
                         'description': feature.description,
-                        'base_cost': float(feature.base_cost or 0),
+                        'base_cost': base_costs.get(feature.id) or Decimal('0'),
                         'is_selected': str(feature.id) in selected_features,
                         'selected_data': selected_features.get(str(feature.id), {})
                     }
-                    for feature in features
+                    for feature in features_by_category.get(category, [])
                 ]
             })
         
@@ -292,33 +360,10 @@ class EcoFeatureSelectionViewSet(
                 status=status.HTTP_403_FORBIDDEN
             )
         
-        # Clear existing selections
-        construction_request.selected_eco_features.all().delete()
-        
-        # Create new selections
-        created_features = []
-        for feature_data in features:
-            feature_id = feature_data.get('id')
-            quantity = feature_data.get('quantity', 1)
-            customizations = feature_data.get('customizations', {})
-            
-            try:
-                eco_feature = EcoFeature.objects.get(id=feature_id)
-                
-                # Create the construction request eco feature
-                feature = ConstructionRequestEcoFeature.objects.create(
-                    construction_request=construction_request,
-                    eco_feature=eco_feature,
-                    quantity=quantity,
-                    customizations=customizations
-                )
-                
-                # Calculate the cost for this feature
-                feature.calculate_cost()
-                created_features.append(feature)
-                
-            except EcoFeature.DoesNotExist:
-                continue
+        # Replace the selections; estimated costs are priced in the same pass
+        created_features = ConstructionRequestEcoFeature.replace_for_request(
+            construction_request, features
+        )
         
         # Update the estimated cost for the construction request
         construction_request.update_estimated_cost()
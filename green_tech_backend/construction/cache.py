@@ -0,0 +1,23 @@
+"""
+Cache keys and invalidation shared by the construction models, signals and views.
+"""
+from django.core.cache import cache
+
+PUBLIC_STATS_CACHE_TIMEOUT = 300
+_PUBLIC_STATS_VERSION_KEY = 'construction:public_project_stats:version'
+
+
+def public_stats_cache_key(status_param, category_param):
+    """Cache key for the public ``stats`` payload of one status/category filter."""
+    # The version counter is shared by every worker through the cache backend,
+    # so bumping it invalidates all status/category variants at once.
+    version = cache.get_or_set(_PUBLIC_STATS_VERSION_KEY, 1, timeout=None)
+    return f'construction:public_project_stats:v{version}:{status_param or ""}:{category_param or ""}'
+
+
+def invalidate_public_project_stats():
+    """Expire every cached ``stats`` payload; called when projects change."""
+    try:
+        cache.incr(_PUBLIC_STATS_VERSION_KEY)
+    except ValueError:
+        cache.set(_PUBLIC_STATS_VERSION_KEY, 1, timeout=None)
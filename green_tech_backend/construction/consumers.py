@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from datetime import timedelta
+
 from asgiref.sync import sync_to_async
 from channels.generic.websocket import AsyncJsonWebsocketConsumer
 from django.contrib.auth import get_user_model
+from django.db import transaction
 from django.utils import timezone
 
 from construction.models import Project, ProjectChatMessage, ProjectMessageReceipt
@@ -12,6 +15,9 @@ from construction.serializers.project_serializers import ProjectMessageSerialize
 
 User = get_user_model()
 
+# Re-reads within this window don't refresh the receipt or broadcast again.
+READ_RECEIPT_DEBOUNCE = timedelta(seconds=1)
+
 
 class ProjectChatConsumer(AsyncJsonWebsocketConsumer):
     group_name_template = 'project-chat-{project_id}'
@@ -58,7 +64,7 @@ class ProjectChatConsumer(AsyncJsonWebsocketConsumer):
             body = content.get('body', '').strip()
             if not body:
                 return
-            message = await self._create_message(body, user, content.get('quote'))
+            message = await self._create_message(body, user)
             await self._broadcast_message(message)
         else:
             return
@@ -72,6 +78,12 @@ class ProjectChatConsumer(AsyncJsonWebsocketConsumer):
     async def chat_read(self, event):
         await self.send_json({'type': 'read', 'payload': event['payload']})
 
+    async def document_ready(self, event):
+        await self.send_json({'type': 'document', 'payload': event['payload']})
+
+    async def construction_cost(self, event):
+        await self.send_json({'type': 'cost', 'payload': event['payload']})
+
     @sync_to_async
     def _get_project(self, project_id: int):
         try:
@@ -85,55 +97,66 @@ class ProjectChatConsumer(AsyncJsonWebsocketConsumer):
         return perm._is_team_member(user, project)
 
     @sync_to_async
-    def _create_message(self, body: str, user: User, quote_id=None):
-        quote = None
-        if quote_id:
-            from quotes.models import Quote
-            try:
-                quote = Quote.objects.get(pk=quote_id)
-            except Quote.DoesNotExist:
-                quote = None
-        message = ProjectChatMessage.objects.create(
-            project=self.project,
-            quote=quote,
-            sender=user,
-            body=body,
-        )
-        ProjectMessageReceipt.objects.get_or_create(
-            message=message,
-            user=user,
-            defaults={'read_at': timezone.now()},
-        )
+    def _create_message(self, body: str, user: User):
+        with transaction.atomic():
+            message = ProjectChatMessage.objects.create(
+                project=self.project,
+                sender=user,
+                body=body,
+            )
+            # A brand-new message has no receipts, so skip get_or_create's SELECT.
+            ProjectMessageReceipt.objects.bulk_create(
+                [ProjectMessageReceipt(message=message, user=user, read_at=timezone.now())],
+                ignore_conflicts=True,
+            )
         notify_project_chat_message(message)
-        return message
+        # Reload with everything the serializer touches so the broadcast doesn't
+        # fan out into one query per related field.
+        return (
+            ProjectChatMessage.objects.select_related('sender')
+            .prefetch_related('attachments', 'receipts__user')
+            .get(pk=message.pk)
+        )
 
     @sync_to_async
     def _mark_read(self, message_id, user: User):
-        try:
-            message = ProjectChatMessage.objects.get(pk=message_id, project=self.project)
-        except ProjectChatMessage.DoesNotExist:
-            return None
-        receipt, created = ProjectMessageReceipt.objects.get_or_create(
-            message=message,
-            user=user,
-            defaults={'read_at': timezone.now()},
+        message = (
+            ProjectChatMessage.objects.filter(pk=message_id, project=self.project)
+            .only('id', 'project_id')
+            .first()
         )
-        updated = created
-        if not created:
-            now = timezone.now()
-            if abs((now - receipt.read_at).total_seconds()) > 1:
-                receipt.read_at = now
-                receipt.save(update_fields=('read_at',))
-                updated = True
+        if message is None:
+            return None
+        now = timezone.now()
+        with transaction.atomic():
+            # Refresh stale receipts in place; only a first read needs an insert.
+            updated = bool(
+                ProjectMessageReceipt.objects.filter(message=message, user=user)
+                .exclude(read_at__range=(now - READ_RECEIPT_DEBOUNCE, now + READ_RECEIPT_DEBOUNCE))
+                .update(read_at=now)
+            )
+            if updated:
+                receipt = ProjectMessageReceipt(message=message, user=user, read_at=now)
+            else:
+                receipt, updated = ProjectMessageReceipt.objects.get_or_create(
+                    message=message,
+                    user=user,
+                    defaults={'read_at': now},
+                )
         return message, receipt, updated
 
+    @sync_to_async
+    def _serialize_message(self, message: ProjectChatMessage):
+        # DRF serializers are synchronous; keep field access off the event loop.
+        return ProjectMessageSerializer(message, context={'request': None}).data
+
     async def _broadcast_message(self, message: ProjectChatMessage):
-        serializer = ProjectMessageSerializer(message, context={'request': None})
+        payload = await self._serialize_message(message)
         await self.channel_layer.group_send(
             self.group_name,
             {
                 'type': 'chat.message',
-                'payload': serializer.data,
+                'payload': payload,
             },
         )
 
@@ -2,17 +2,97 @@
 Document generation for construction requests.
 Generates PDF specifications and other documents for construction projects.
 """
+import hashlib
 import os
+from functools import lru_cache
 from io import BytesIO
 from datetime import datetime
-from django.template.loader import render_to_string
+from django.template.loader import get_template
 from django.conf import settings
+from django.core.cache import cache
 from django.utils import timezone
 from django.templatetags.static import static
-from xhtml2pdf import pisa
-from weasyprint import HTML, CSS
 from construction.models import ConstructionRequest, ConstructionRequestEcoFeature
-from construction.ghana.models import GhanaRegion
+
+
+SPEC_PDF_CACHE_TIMEOUT = 60 * 60 * 24
+
+_SPEC_CSS_TEXT = '''
+    @page {
+        size: A4;
+        margin: 2cm;
+        @top-right {
+            content: "Page " counter(page) " of " counter(pages);
+            font-size: 10pt;
+            color: #666;
+        }
+    }
+    body {
+        font-family: Arial, sans-serif;
+        line-height: 1.6;
+        color: #333;
+    }
+    .header {
+        text-align: center;
+        margin-bottom: 30px;
+        border-bottom: 2px solid #4CAF50;
+        padding-bottom: 10px;
+    }
+    .logo {
+        max-width: 200px;
+        margin-bottom: 20px;
+    }
+    h1, h2, h3 {
+        color: #2E7D32;
+    }
+    .section {
+        margin-bottom: 20px;
+        page-break-inside: avoid;
+    }
+    .feature-table {
+        width: 100%;
+        border-collapse: collapse;
+        margin: 20px 0;
+    }
+    .feature-table th, .feature-table td {
+        border: 1px solid #ddd;
+        padding: 8px;
+        text-align: left;
+    }
+    .feature-table th {
+        background-color: #f2f2f2;
+    }
+    .cost-summary {
+        background-color: #f9f9f9;
+        padding: 15px;
+        border-left: 4px solid #4CAF50;
+        margin: 20px 0;
+    }
+    .footer {
+        margin-top: 30px;
+        font-size: 10pt;
+        text-align: center;
+        color: #666;
+    }
+'''
+
+
+@lru_cache(maxsize=1)
+def _spec_css():
+    """Parse the specification stylesheet once per process."""
+    from weasyprint import CSS
+
+    return CSS(string=_SPEC_CSS_TEXT)
+
+
+@lru_cache(maxsize=1)
+def _spec_template():
+    """Load and compile the specification template once per process.
+
+    Django only keeps compiled templates when the cached loader is enabled,
+    which is not the case with DEBUG on or custom loader settings.
+    """
+    return get_template('construction/specification_document.html')
 
 
 def generate_specification_document(construction_request):
@@ -25,19 +105,22 @@ def generate_specification_document(construction_request):
     Returns:
         BytesIO: A file-like object containing the generated PDF.
     """
-    # Get related data
-    eco_features = construction_request.selected_eco_features.all()
+    # Get related data, limited to the columns the template renders
+    eco_features = construction_request.selected_eco_features.select_related('eco_feature').only(
+        'quantity',
+        'custom_specifications',
+        'estimated_cost',
+        'eco_feature',
+        'eco_feature__name',
+        'eco_feature__description',
+        'eco_feature__category',
+    )
     
     # Calculate total estimated cost
     total_cost = construction_request.estimated_cost or 0
     
     # Get region data for multipliers if available
-    region = None
-    if construction_request.region:
-        try:
-            region = GhanaRegion.objects.get(name=construction_request.region)
-        except GhanaRegion.DoesNotExist:
-            pass
+    region = construction_request.ghana_region
     
     # Prepare context for template
     context = {
@@ -50,78 +133,53 @@ def generate_specification_document(construction_request):
     }
     
     # Render HTML template
-    html_string = render_to_string('construction/specification_document.html', context)
+    html_string = _spec_template().render(context)
     
     # Generate PDF
     pdf_file = BytesIO()
     
-    # Using weasyprint for better CSS support
+    # WeasyPrint loads Pango/cairo on import, so only pay for it when rendering.
+    from weasyprint import HTML
+
     html = HTML(string=html_string, base_url=settings.BASE_DIR)
-    css = CSS(string='''
-        @page {
-            size: A4;
-            margin: 2cm;
-            @top-right {
-                content: "Page " counter(page) " of " counter(pages);
-                font-size: 10pt;
-                color: #666;
-            }
-        }
-        body {
-            font-family: Arial, sans-serif;
-            line-height: 1.6;
-            color: #333;
-        }
-        .header {
-            text-align: center;
-            margin-bottom: 30px;
-            border-bottom: 2px solid #4CAF50;
-            padding-bottom: 10px;
-        }
-        .logo {
-            max-width: 200px;
-            margin-bottom: 20px;
-        }
-        h1, h2, h3 {
-            color: #2E7D32;
-        }
-        .section {
-            margin-bottom: 20px;
-            page-break-inside: avoid;
-        }
-        .feature-table {
-            width: 100%;
-            border-collapse: collapse;
-            margin: 20px 0;
-        }
-        .feature-table th, .feature-table td {
-            border: 1px solid #ddd;
-            padding: 8px;
-            text-align: left;
-        }
-        .feature-table th {
-            background-color: #f2f2f2;
-        }
-        .cost-summary {
-            background-color: #f9f9f9;
-            padding: 15px;
-            border-left: 4px solid #4CAF50;
-            margin: 20px 0;
-        }
-        .footer {
-            margin-top: 30px;
-            font-size: 10pt;
-            text-align: center;
-            color: #666;
-        }
-    ''')
-    
-    html.write_pdf(pdf_file, stylesheets=[css])
+    html.write_pdf(pdf_file, stylesheets=[_spec_css()])
     pdf_file.seek(0)
     
     return pdf_file
 
 
+def specification_cache_key(construction_request):
+    """
+    Build the cache key for a request's rendered specification.
+
+    The key changes whenever the request is saved (``updated_at``) or its
+    eco-feature selections are added, edited or removed.
+    """
+    selections = construction_request.selected_eco_features.order_by('pk').values_list(
+        'pk', 'quantity', 'updated_at'
+    )
+    digest = hashlib.sha1(repr(list(selections)).encode()).hexdigest()
+    revision = construction_request.updated_at.timestamp()
+    return f'construction:spec_pdf:{construction_request.pk}:{revision}:{digest}'
+
+
+def render_specification_pdf(construction_request):
+    """
+    Return the specification PDF bytes, rendering only when the request changed.
+
+    Args:
+        construction_request (ConstructionRequest): The construction request.
+
+    Returns:
+        bytes: The rendered PDF.
+    """
+    return cache.get_or_set(
+        specification_cache_key(construction_request),
+        lambda: generate_specification_document(construction_request).getvalue(),
+        SPEC_PDF_CACHE_TIMEOUT,
+    )
+
+
 def generate_document_filename(construction_request, doc_type='specification'):
     """
     Generate a standardized filename for a construction document.
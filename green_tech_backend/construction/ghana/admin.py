@@ -30,6 +30,13 @@ class GhanaPricingAdmin(admin.ModelAdmin):
     list_select_related = ('eco_feature', 'region')
     ordering = ('eco_feature__name', 'region__name')
     
+    def get_queryset(self, request):
+        # Multiply in the database instead of per row in Python.
+        return super().get_queryset(request).annotate(
+            _adjusted_price=GhanaPricing.adjusted_price_expression()
+        )
+    
     def get_adjusted_price(self, obj):
-        return f"{obj.get_adjusted_price():.2f}"
+        return f"{obj._adjusted_price:.2f}"
     get_adjusted_price.short_description = 'Adjusted Price'
+    get_adjusted_price.admin_order_field = '_adjusted_price'
@@ -1,8 +1,16 @@
+from decimal import Decimal
+
+from django.core.cache import cache
 from django.db import models
+from django.db.models import DecimalField, ExpressionWrapper, F
 from django.utils.translation import gettext_lazy as _
 from django.core.validators import MinValueValidator
 
 
+REGION_CACHE_TIMEOUT = 60 * 60
+CENTS = Decimal('0.01')
+
+
 class GhanaRegion(models.Model):
     """Model representing regions in Ghana with cost multipliers."""
     class RegionName(models.TextChoices):
@@ -48,7 +56,33 @@ class GhanaRegion(models.Model):
         ordering = ['name']
 
     def __str__(self):
-        return self.get_name_display()
+        return str(_REGION_NAME_DISPLAY.get(self.name, self.name))
+
+    @staticmethod
+    def cache_key(name):
+        return f'construction:ghana_region:{name}'
+
+    @classmethod
+    def get_by_name(cls, name):
+        """
+        Return the region called ``name``, or None.
+
+        Regions are near-static reference data, so lookups are served from the
+        cache; the entry is dropped whenever the region is saved or deleted.
+        """
+        if not name:
+            return None
+        key = cls.cache_key(name)
+        region = cache.get(key)
+        if region is None:
+            region = cls.objects.filter(name=name).first()
+            if region is not None:
+                cache.set(key, region, REGION_CACHE_TIMEOUT)
+        return region
+
+
+# Built once so __str__ (admin rows, FK dropdowns) skips get_name_display().
+_REGION_NAME_DISPLAY = dict(GhanaRegion.RegionName.choices)
 
 
 class EcoFeature(models.Model):
@@ -90,6 +124,10 @@ class EcoFeature(models.Model):
         verbose_name = _('eco feature')
         verbose_name_plural = _('eco features')
         ordering = ['category', 'name']
+        indexes = [
+            # Category listings and the admin category/availability filters.
+            models.Index(fields=['category', 'is_available'], name='eco_cat_avail_idx'),
+        ]
 
     def __str__(self):
         return self.name
@@ -140,6 +178,14 @@ class GhanaPricing(models.Model):
     def __str__(self):
         return f"{self.eco_feature.name} - {self.region.name} ({self.get_currency_display()})"
 
+    @staticmethod
+    def adjusted_price_expression():
+        """Database-side equivalent of ``get_adjusted_price`` for annotations."""
+        return ExpressionWrapper(
+            F('base_price') * F('region__cost_multiplier'),
+            output_field=DecimalField(max_digits=14, decimal_places=2),
+        )
+
     def get_adjusted_price(self):
         """Return the price adjusted by the region's cost multiplier."""
-        return round(float(self.base_price) * float(self.region.cost_multiplier), 2)
+        return (self.base_price * self.region.cost_multiplier).quantize(CENTS)
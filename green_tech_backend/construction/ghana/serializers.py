@@ -1,11 +1,37 @@
 """
 Serializers for Ghana-specific construction features.
 """
+import copy
+import threading
+
 from rest_framework import serializers
 from .models import EcoFeature, GhanaRegion, GhanaPricing
 
 
-class EcoFeatureSerializer(serializers.ModelSerializer):
+class CachedFieldsSerializer(serializers.ModelSerializer):
+    """
+    ModelSerializer that introspects its model fields once per class.
+
+    Only for serializers whose fields don't depend on the instance or context.
+    Each serializer still gets its own deep copy, since DRF binds fields to
+    their parent.
+    """
+    _fields_cache = {}
+    _fields_cache_lock = threading.Lock()
+
+    def get_fields(self):
+        serializer_class = type(self)
+        fields = self._fields_cache.get(serializer_class)
+        if fields is None:
+            with self._fields_cache_lock:
+                fields = self._fields_cache.get(serializer_class)
+                if fields is None:
+                    fields = super().get_fields()
+                    self._fields_cache[serializer_class] = fields
+        return copy.deepcopy(fields)
+
+
+class EcoFeatureSerializer(CachedFieldsSerializer):
     """Serializer for eco-friendly features available in Ghana."""
     category_display = serializers.CharField(
         source='get_category_display',
@@ -22,7 +48,7 @@ class EcoFeatureSerializer(serializers.ModelSerializer):
         read_only_fields = ('id', 'created_at', 'updated_at')
 
 
-class GhanaRegionSerializer(serializers.ModelSerializer):
+class GhanaRegionSerializer(CachedFieldsSerializer):
     """Serializer for Ghana regions with cost multipliers."""
     name_display = serializers.CharField(
         source='get_name_display',
@@ -38,7 +64,7 @@ class GhanaRegionSerializer(serializers.ModelSerializer):
         read_only_fields = ('id', 'created_at', 'updated_at')
 
 
-class GhanaPricingSerializer(serializers.ModelSerializer):
+class GhanaPricingSerializer(CachedFieldsSerializer):
     """Serializer for regional pricing variations in Ghana."""
     region_details = GhanaRegionSerializer(source='region', read_only=True)
     eco_feature_details = EcoFeatureSerializer(source='eco_feature', read_only=True)
@@ -46,7 +72,8 @@ class GhanaPricingSerializer(serializers.ModelSerializer):
         source='get_currency_display',
         read_only=True
     )
-    adjusted_price = serializers.SerializerMethodField()
+    # Annotated by the viewset queryset via GhanaPricing.adjusted_price_expression()
+    adjusted_price = serializers.DecimalField(max_digits=14, decimal_places=2, read_only=True)
     
     class Meta:
         model = GhanaPricing
@@ -56,7 +83,3 @@ class GhanaPricingSerializer(serializers.ModelSerializer):
             'is_active', 'notes', 'created_at', 'updated_at'
         ]
         read_only_fields = ('id', 'adjusted_price', 'created_at', 'updated_at')
-    
-    def get_adjusted_price(self, obj):
-        """Get the price adjusted by the region's cost multiplier."""
-        return obj.get_adjusted_price()
\ No newline at end of file
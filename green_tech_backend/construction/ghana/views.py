@@ -0,0 +1,118 @@
+"""
+API views for Ghana-specific construction reference data.
+"""
+from rest_framework import serializers, viewsets
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from .models import EcoFeature, GhanaPricing, GhanaRegion
+from .serializers import EcoFeatureSerializer, GhanaPricingSerializer, GhanaRegionSerializer
+
+
+def _serialized_columns(serializer_class):
+    """Concrete model columns rendered by ``serializer_class``, in Meta.fields order."""
+    meta = serializer_class.Meta
+    columns = {field.name for field in meta.model._meta.concrete_fields}
+    return tuple(name for name in meta.fields if name in columns)
+
+
+# Only the columns the pricing payload renders are read, for the row and its
+# nested region/eco-feature.
+PRICING_COLUMNS = _serialized_columns(GhanaPricingSerializer)
+REGION_COLUMNS = _serialized_columns(GhanaRegionSerializer)
+ECO_FEATURE_COLUMNS = _serialized_columns(EcoFeatureSerializer)
+RELATED_COLUMNS = (
+    *(f'region__{field}' for field in REGION_COLUMNS),
+    *(f'eco_feature__{field}' for field in ECO_FEATURE_COLUMNS),
+)
+
+_REGION_LABELS = dict(GhanaRegion.RegionName.choices)
+_CATEGORY_LABELS = dict(EcoFeature.FeatureCategory.choices)
+_CURRENCY_LABELS = dict(GhanaPricing.Currency.choices)
+
+# Unbound DRF fields, used only to format values exactly as the serializer does.
+_DATETIME = serializers.DateTimeField()
+_BASE_PRICE = serializers.DecimalField(max_digits=12, decimal_places=2)
+_ADJUSTED_PRICE = serializers.DecimalField(max_digits=14, decimal_places=2)
+_MULTIPLIER = serializers.DecimalField(max_digits=5, decimal_places=2)
+
+
+def _format_datetime(value):
+    return _DATETIME.to_representation(value) if value is not None else None
+
+
+class GhanaPricingViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    Read-only API endpoint for regional eco-feature pricing.
+    """
+    serializer_class = GhanaPricingSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        """Return pricing rows with their region and eco-feature joined in."""
+        # The nested region/eco-feature details read the related rows, so they
+        # are fetched in the same query; the adjusted price is computed there too.
+        queryset = GhanaPricing.objects.select_related('region', 'eco_feature').only(
+            *PRICING_COLUMNS, *RELATED_COLUMNS
+        ).annotate(
+            adjusted_price=GhanaPricing.adjusted_price_expression()
+        )
+
+        region = self.request.query_params.get('region')
+        if region:
+            queryset = queryset.filter(region__name=region)
+        eco_feature = self.request.query_params.get('eco_feature')
+        if eco_feature:
+            queryset = queryset.filter(eco_feature_id=eco_feature)
+        return queryset
+
+    def list(self, request, *args, **kwargs):
+        """
+        List pricing rows from a single values() query.
+
+        Produces the same payload as GhanaPricingSerializer without building
+        model instances or nested serializers per row.
+        """
+        queryset = self.filter_queryset(self.get_queryset()).values(
+            *PRICING_COLUMNS, 'adjusted_price', *RELATED_COLUMNS
+        )
+        page = self.paginate_queryset(queryset)
+        rows = page if page is not None else queryset
+        data = [self._list_representation(row) for row in rows]
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)
+
+    @staticmethod
+    def _list_representation(row):
+        region = {field: row[f'region__{field}'] for field in REGION_COLUMNS}
+        region.update(
+            name_display=str(_REGION_LABELS.get(region['name'], region['name'])),
+            cost_multiplier=_MULTIPLIER.to_representation(region['cost_multiplier']),
+            created_at=_format_datetime(region['created_at']),
+            updated_at=_format_datetime(region['updated_at']),
+        )
+        eco_feature = {field: row[f'eco_feature__{field}'] for field in ECO_FEATURE_COLUMNS}
+        eco_feature.update(
+            category_display=str(_CATEGORY_LABELS.get(eco_feature['category'], eco_feature['category'])),
+            created_at=_format_datetime(eco_feature['created_at']),
+            updated_at=_format_datetime(eco_feature['updated_at']),
+        )
+        adjusted_price = row['adjusted_price']
+        return {
+            'id': row['id'],
+            'region': row['region'],
+            'region_details': region,
+            'eco_feature': row['eco_feature'],
+            'eco_feature_details': eco_feature,
+            'base_price': _BASE_PRICE.to_representation(row['base_price']),
+            'currency': row['currency'],
+            'currency_display': str(_CURRENCY_LABELS.get(row['currency'], row['currency'])),
+            'adjusted_price': (
+                _ADJUSTED_PRICE.to_representation(adjusted_price) if adjusted_price is not None else None
+            ),
+            'is_active': row['is_active'],
+            'notes': row['notes'],
+            'created_at': _format_datetime(row['created_at']),
+            'updated_at': _format_datetime(row['updated_at']),
+        }
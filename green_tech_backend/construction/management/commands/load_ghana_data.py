@@ -1,18 +1,72 @@
+import os
+
+from django.core import serializers
+from django.core.cache import cache
 from django.core.management.base import BaseCommand
-from django.core.management import call_command
+from django.core.management.color import no_style
+from django.db import connection, transaction
+
+from construction.ghana.models import GhanaRegion
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'fixtures')
+
+# Loaded in foreign-key order: pricing rows reference regions and eco-features.
+FIXTURES = (
+    ('Ghana regions', 'ghana_regions.json'),
+    ('eco-features', 'eco_features.json'),
+    ('Ghana pricing data', 'ghana_pricing.json'),
+)
+
+BATCH_SIZE = 500
 
 
 class Command(BaseCommand):
     help = 'Load initial Ghana regions, eco-features, and pricing data'
 
     def handle(self, *args, **options):
-        self.stdout.write('Loading Ghana regions...')
-        call_command('loaddata', 'ghana_regions.json', app_label='construction')
-        
-        self.stdout.write('Loading eco-features...')
-        call_command('loaddata', 'eco_features.json', app_label='construction')
-        
-        self.stdout.write('Loading Ghana pricing data...')
-        call_command('loaddata', 'ghana_pricing.json', app_label='construction')
-        
+        loaded = []
+        with transaction.atomic():
+            for label, fixture in FIXTURES:
+                self.stdout.write(f'Loading {label}...')
+                objects = self._load_fixture(fixture)
+                loaded.extend(objects)
+                self.stdout.write(f'  {len(objects)} rows')
+
+        # bulk_create skips the post_save receiver that expires cached regions,
+        # so drop those entries here, once the new rows are committed.
+        cache.delete_many([
+            GhanaRegion.cache_key(obj.name) for obj in loaded if isinstance(obj, GhanaRegion)
+        ])
         self.stdout.write(self.style.SUCCESS('Successfully loaded all Ghana data!'))
+
+    def _load_fixture(self, fixture):
+        """
+        Upsert a fixture's rows with bulk_create instead of loaddata's per-row save().
+
+        Returns the loaded model instances.
+        """
+        with open(os.path.join(FIXTURE_DIR, fixture)) as stream:
+            objects = [item.object for item in serializers.deserialize('json', stream)]
+        if not objects:
+            return objects
+
+        model = type(objects[0])
+        # Re-running the command refreshes existing rows like loaddata did,
+        # but keeps their original creation timestamps.
+        update_fields = [
+            field.name for field in model._meta.concrete_fields
+            if not field.primary_key and not getattr(field, 'auto_now_add', False)
+        ]
+        model.objects.bulk_create(
+            objects,
+            batch_size=BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=[model._meta.pk.name],
+            update_fields=update_fields,
+        )
+
+        # Rows were inserted with explicit ids, so move the id sequence past them.
+        with connection.cursor() as cursor:
+            for sql in connection.ops.sequence_reset_sql(no_style(), [model]):
+                cursor.execute(sql)
+        return objects
@@ -0,0 +1,84 @@
+from collections import defaultdict
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from construction.ghana.models import GhanaPricing, GhanaRegion
+from construction.models import ConstructionRequest, ConstructionRequestEcoFeature
+from construction.models.request import CENTS
+
+BATCH_SIZE = 500
+
+
+class Command(BaseCommand):
+    help = 'Re-price every eco-feature selection and construction request estimate'
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            selections, requests = self._recalculate()
+
+        self.stdout.write(f'  {selections} eco-feature selections re-priced')
+        self.stdout.write(f'  {requests} construction request estimates updated')
+        self.stdout.write(self.style.SUCCESS('Successfully recalculated construction costs!'))
+
+    def _recalculate(self):
+        """
+        Recompute costs for all requests with a fixed number of queries.
+
+        Regions and prices are loaded once and shared across every request,
+        rather than resolved per request as update_estimated_cost does.
+        """
+        regions = GhanaRegion.objects.in_bulk(field_name='name')
+        base_prices = {
+            (region_id, eco_feature_id): base_price
+            for region_id, eco_feature_id, base_price in GhanaPricing.objects.filter(
+                is_active=True
+            ).values_list('region_id', 'eco_feature_id', 'base_price')
+        }
+        requests = {
+            request.pk: request
+            for request in ConstructionRequest.objects.only('id', 'region', 'budget', 'estimated_cost')
+        }
+
+        now = timezone.now()
+        feature_costs = defaultdict(Decimal)
+        changed_selections = []
+        selections = ConstructionRequestEcoFeature.objects.order_by().only(
+            'id', 'construction_request_id', 'eco_feature_id', 'quantity', 'estimated_cost'
+        )
+        for selection in selections.iterator(chunk_size=BATCH_SIZE):
+            region = regions.get(requests[selection.construction_request_id].region)
+            unit_price = None
+            if region is not None:
+                base_price = base_prices.get((region.pk, selection.eco_feature_id))
+                if base_price is not None:
+                    unit_price = base_price * region.cost_multiplier
+            estimated_cost = ConstructionRequestEcoFeature._line_cost(unit_price, selection.quantity)
+            if estimated_cost is not None:
+                feature_costs[selection.construction_request_id] += estimated_cost
+            if selection.estimated_cost != estimated_cost:
+                selection.estimated_cost = estimated_cost
+                selection.updated_at = now
+                changed_selections.append(selection)
+        ConstructionRequestEcoFeature.objects.bulk_update(
+            changed_selections, ['estimated_cost', 'updated_at'], batch_size=BATCH_SIZE
+        )
+
+        changed_requests = []
+        for request in requests.values():
+            # Requests outside a known region keep their estimate, as in update_estimated_cost().
+            if request.region not in regions:
+                continue
+            estimated_cost = (
+                (request.budget or Decimal('0')) + feature_costs[request.pk]
+            ).quantize(CENTS)
+            if request.estimated_cost != estimated_cost:
+                request.estimated_cost = estimated_cost
+                request.updated_at = now
+                changed_requests.append(request)
+        ConstructionRequest.objects.bulk_update(
+            changed_requests, ['estimated_cost', 'updated_at'], batch_size=BATCH_SIZE
+        )
+        return len(changed_selections), len(changed_requests)
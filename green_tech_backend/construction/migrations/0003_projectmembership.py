@@ -0,0 +1,60 @@
+# Generated manually for denormalized project team membership
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def populate_memberships(apps, schema_editor):
+    """
+    Backfill membership rows from the existing project team fields.
+    """
+    Project = apps.get_model('construction', 'Project')
+    ProjectMembership = apps.get_model('construction', 'ProjectMembership')
+
+    rows = []
+    projects = Project.objects.select_related('construction_request').prefetch_related('contractors')
+    for project in projects.iterator(chunk_size=500):
+        members = set()
+        if project.project_manager_id:
+            members.add((project.project_manager_id, 'project_manager'))
+        if project.site_supervisor_id:
+            members.add((project.site_supervisor_id, 'site_supervisor'))
+        for contractor in project.contractors.all():
+            members.add((contractor.pk, 'contractor'))
+        if project.construction_request_id and project.construction_request.client_id:
+            members.add((project.construction_request.client_id, 'client'))
+        rows.extend(
+            ProjectMembership(project_id=project.pk, user_id=user_id, role=role)
+            for user_id, role in members
+        )
+    ProjectMembership.objects.bulk_create(rows, batch_size=1000, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('construction', '0002_remove_quote_models'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectMembership',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('role', models.CharField(choices=[('project_manager', 'Project Manager'), ('site_supervisor', 'Site Supervisor'), ('contractor', 'Contractor'), ('client', 'Client')], max_length=20, verbose_name='role')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='memberships', to='construction.project', verbose_name='project')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='project_memberships', to=settings.AUTH_USER_MODEL, verbose_name='user')),
+            ],
+            options={
+                'verbose_name': 'project membership',
+                'verbose_name_plural': 'project memberships',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='projectmembership',
+            constraint=models.UniqueConstraint(fields=('project', 'user', 'role'), name='unique_project_membership_role'),
+        ),
+        migrations.RunPython(populate_memberships, migrations.RunPython.noop),
+    ]
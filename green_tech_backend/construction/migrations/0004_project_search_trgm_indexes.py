@@ -0,0 +1,42 @@
+# Generated manually for public project keyword search
+
+from django.db import migrations
+
+
+TRIGRAM_INDEXES = (
+    ('construction_project_title_trgm', 'title'),
+    ('construction_project_description_trgm', 'description'),
+)
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """
+    Index the expression Django emits for ``icontains`` on PostgreSQL
+    (``UPPER(col::text) LIKE UPPER(%s)``) so keyword filters can use a GIN probe.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON construction_project '
+            f'USING gin (UPPER({column}::text) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, _column in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('construction', '0003_projectmembership'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,21 @@
+# Generated manually for the public featured projects listing
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('construction', '0004_project_search_trgm_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(
+                condition=models.Q(('status__in', ['COMPLETED', 'IN_PROGRESS'])),
+                fields=['-created_at'],
+                name='proj_featured_idx',
+            ),
+        ),
+    ]
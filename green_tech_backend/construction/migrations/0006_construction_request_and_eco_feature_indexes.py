@@ -0,0 +1,25 @@
+# Generated manually for the construction request and eco-feature filters
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('construction', '0005_project_featured_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='constructionrequest',
+            index=models.Index(fields=['client', 'status'], name='cr_client_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='constructionrequest',
+            index=models.Index(fields=['client', 'current_step'], name='cr_client_step_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ecofeature',
+            index=models.Index(fields=['category', 'is_available'], name='eco_cat_avail_idx'),
+        ),
+    ]
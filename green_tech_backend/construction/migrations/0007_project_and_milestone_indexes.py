@@ -0,0 +1,33 @@
+# Generated manually for the project and milestone filters
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('construction', '0006_construction_request_and_eco_feature_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['-created_at'], name='proj_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['status', 'planned_end_date'], name='proj_status_end_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['property', 'status'], name='proj_property_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='projectmilestone',
+            index=models.Index(fields=['project', 'status'], name='milestone_project_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='projectmilestone',
+            index=models.Index(fields=['project', 'planned_start_date'], name='milestone_project_start_idx'),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated manually for denormalized project milestone counters
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def populate_milestone_counters(apps, schema_editor):
+    """
+    Backfill the milestone counters from the existing milestones.
+    """
+    Project = apps.get_model('construction', 'Project')
+    ProjectMilestone = apps.get_model('construction', 'ProjectMilestone')
+
+    milestones = ProjectMilestone.objects.filter(project=OuterRef('pk')).order_by().values('project')
+    Project.objects.update(
+        milestones_total=Coalesce(
+            Subquery(milestones.annotate(count=Count('pk')).values('count')), 0
+        ),
+        milestones_completed=Coalesce(
+            Subquery(milestones.filter(status='COMPLETED').annotate(count=Count('pk')).values('count')), 0
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('construction', '0007_project_and_milestone_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='milestones_total',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='milestones'),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='milestones_completed',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='completed milestones'),
+        ),
+        migrations.RunPython(populate_milestone_counters, migrations.RunPython.noop),
+    ]
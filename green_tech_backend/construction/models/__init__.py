@@ -7,6 +7,8 @@ from .project import (
     Project,
     ProjectStatus,
     ProjectPhase,
+    ProjectMembership,
+    ProjectMembershipRole,
     ProjectMilestone,
     MilestoneStatus,
     ProjectDocument,
@@ -29,6 +31,8 @@ __all__ = [
     'Project',
     'ProjectStatus',
     'ProjectPhase',
+    'ProjectMembership',
+    'ProjectMembershipRole',
     'ProjectMilestone',
     'MilestoneStatus',
     'ProjectDocument',
@@ -1,22 +1,44 @@
 """
 Project and milestone models for construction project tracking.
 """
+from decimal import ROUND_HALF_UP, Decimal
 from uuid import uuid4
 
-from django.db import models
+from django.db import connection, models, transaction
 from django.utils.translation import gettext_lazy as _
 from django.utils import timezone
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.core.exceptions import ValidationError
-from django.db.models import Sum, F, Q, Case, When, Value, IntegerField
-from django.db.models.functions import Coalesce
+from django.db.models import (
+    BooleanField, Count, DecimalField, OuterRef, Subquery, Sum, F, Q, Case, When, Value, IntegerField,
+)
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Coalesce, Round
 from builtins import property as builtin_property
 from django.contrib.auth import get_user_model
 
+from construction.cache import invalidate_public_project_stats
 from properties.models import Property
 
 User = get_user_model()
 
+CENTS = Decimal('0.01')
+
+
+# Project columns maintained by F() updates rather than Project.save().
+MILESTONE_COUNTER_FIELDS = frozenset({'milestones_total', 'milestones_completed'})
+
+
+# Project columns mirrored into ProjectMembership.
+PROJECT_TEAM_FIELDS = frozenset({'project_manager', 'site_supervisor', 'construction_request'})
+_PROJECT_TEAM_ATTNAMES = ('project_manager_id', 'site_supervisor_id', 'construction_request_id')
+
+
+def _remember_saved_status(instance, update_fields=None):
+    """Record the status just written, so the next save() compares against it."""
+    if update_fields is None or 'status' in update_fields:
+        instance._loaded_status = instance.status
+
 
 class ProjectStatus(models.TextChoices):
     """Status choices for construction projects."""
@@ -29,6 +51,10 @@ class ProjectStatus(models.TextChoices):
     DELAYED = 'DELAYED', _('Delayed')
 
 
+# Built once so __str__ (admin rows, reprs) skips get_status_display().
+_PROJECT_STATUS_DISPLAY = dict(ProjectStatus.choices)
+
+
 class ProjectPhase(models.TextChoices):
     """Phases of a construction project."""
     SITE_PREPARATION = 'SITE_PREPARATION', _('Site Preparation')
@@ -48,6 +74,113 @@ class ProjectPhase(models.TextChoices):
     COMPLETED = 'COMPLETED', _('Completed')
 
 
+class ProjectQuerySet(models.QuerySet):
+    def update(self, **kwargs):
+        """
+        Bulk update that keeps ProjectMembership in step with team changes.
+
+        update() sends no signals, so team fields written through it are
+        re-synced here; other updates pass straight through.
+        """
+        team_fields = {name.removesuffix('_id') for name in kwargs} & PROJECT_TEAM_FIELDS
+        if not team_fields:
+            return super().update(**kwargs)
+        with transaction.atomic():
+            project_ids = list(self.values_list('pk', flat=True))
+            updated = super().update(**kwargs)
+            projects = self.model.objects.filter(pk__in=project_ids).select_related('construction_request')
+            for project in projects:
+                ProjectMembership.sync_for_project(project)
+        return updated
+    
+    def with_related(self):
+        """
+        Join and prefetch the relations project serializers read.
+
+        Use this as the entry point for list/detail views instead of letting
+        each row lazily load its team, request and milestones.
+        """
+        return self.select_related(
+            'project_manager',
+            'site_supervisor',
+            'property',
+            'created_by',
+            'construction_request',
+        ).prefetch_related('contractors', 'milestones')
+    
+    def with_metrics(self):
+        """
+        Annotate ``budget_utilization`` and ``is_behind_schedule`` in SQL.
+
+        The matching Project properties return these annotations when present
+        instead of recomputing them per row.
+        """
+        today = timezone.now().date()
+        return self.annotate(
+            _budget_utilization=Case(
+                When(estimated_budget=0, then=Value(Decimal('0'))),
+                # A decimal literal keeps SQLite, which stores whole amounts as
+                # integers, from falling back to integer division.
+                default=Round(F('actual_cost') * Value(Decimal('100.00')) / F('estimated_budget'), 2),
+                output_field=DecimalField(max_digits=16, decimal_places=2),
+            ),
+            _is_behind_schedule=Case(
+                When(
+                    Q(planned_end_date__isnull=True) | Q(actual_start_date__isnull=True),
+                    then=Value(False),
+                ),
+                When(
+                    status=ProjectStatus.COMPLETED,
+                    actual_end_date__gt=F('planned_end_date'),
+                    then=Value(True),
+                ),
+                When(status=ProjectStatus.COMPLETED, actual_end_date__isnull=False, then=Value(False)),
+                When(status=ProjectStatus.IN_PROGRESS, planned_end_date__lt=today, then=Value(True)),
+                default=Value(False),
+                output_field=BooleanField(),
+            ),
+        )
+    
+    def complete(self):
+        """
+        Mark every project in this queryset completed, with its open milestones.
+
+        Uses one UPDATE per table instead of a Project.save() per project, so
+        per-instance save() side effects and signals do not run.
+        Returns the number of projects completed.
+        """
+        now = timezone.now()
+        today = now.date()
+        pending = self.exclude(status=ProjectStatus.COMPLETED)
+        with transaction.atomic():
+            # Milestones first: once the projects are updated they no longer match ``pending``.
+            ProjectMilestone.objects.filter(
+                project__in=pending.values('pk'),
+                status__in=OPEN_MILESTONE_STATUSES,
+            ).update(
+                status=MilestoneStatus.COMPLETED,
+                actual_end_date=today,
+                completion_percentage=100,
+                updated_at=now,
+            )
+            completed = pending.update(
+                status=ProjectStatus.COMPLETED,
+                actual_end_date=Coalesce(F('actual_end_date'), Value(today)),
+                milestones_completed=Coalesce(
+                    Subquery(
+                        ProjectMilestone.objects.filter(
+                            project=OuterRef('pk'), status=MilestoneStatus.COMPLETED
+                        ).order_by().values('project').annotate(count=Count('pk')).values('count')
+                    ),
+                    0,
+                ),
+                updated_at=now,
+            )
+        if completed:
+            invalidate_public_project_stats()
+        return completed
+
+
 class Project(models.Model):
     """Model representing a construction project."""
     # Basic Information
@@ -130,6 +263,10 @@ class Project(models.Model):
         default='GHS'  # Ghanaian Cedi by default
     )
     
+    # Denormalized milestone counters, kept in step by the milestone signals
+    milestones_total = models.PositiveIntegerField(_('milestones'), default=0, editable=False)
+    milestones_completed = models.PositiveIntegerField(_('completed milestones'), default=0, editable=False)
+    
     # Metadata
     created_at = models.DateTimeField(_('created at'), auto_now_add=True)
     updated_at = models.DateTimeField(_('updated at'), auto_now=True)
@@ -140,10 +277,25 @@ class Project(models.Model):
         verbose_name=_('created by')
     )
     
+    objects = ProjectQuerySet.as_manager()
+    
     class Meta:
         verbose_name = _('project')
         verbose_name_plural = _('projects')
         ordering = ['-created_at']
+        indexes = [
+            # Backs the public ``featured`` listing (newest active projects).
+            models.Index(
+                fields=['-created_at'],
+                name='proj_featured_idx',
+                condition=Q(status__in=[ProjectStatus.COMPLETED, ProjectStatus.IN_PROGRESS]),
+            ),
+            # Default ordering of project listings.
+            models.Index(fields=['-created_at'], name='proj_created_idx'),
+            # Behind-schedule reports filter on status and planned end date.
+            models.Index(fields=['status', 'planned_end_date'], name='proj_status_end_idx'),
+            models.Index(fields=['property', 'status'], name='proj_property_status_idx'),
+        ]
         permissions = [
             ('can_manage_projects', 'Can manage all projects'),
             ('can_view_all_projects', 'Can view all projects'),
@@ -151,7 +303,7 @@ class Project(models.Model):
         ]
     
     def __str__(self):
-        return f"{self.title} ({self.get_status_display()})"
+        return f"{self.title} ({_PROJECT_STATUS_DISPLAY.get(self.status, self.status)})"
     
     def clean(self):
         """Validate project data."""
@@ -181,51 +333,97 @@ class Project(models.Model):
                 'site_supervisor': 'Site supervisor must be a staff member.'
             })
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored status so save() can detect transitions without a SELECT.
+        if 'status' in field_names:
+            instance._loaded_status = instance.status
+        # And the team, so membership is only re-synced when it actually changes.
+        if all(attname in field_names for attname in _PROJECT_TEAM_ATTNAMES):
+            instance._loaded_team_ids = instance.team_ids()
+        return instance
+    
+    def team_ids(self):
+        """The (project manager, site supervisor, construction request) ids."""
+        return tuple(getattr(self, attname) for attname in _PROJECT_TEAM_ATTNAMES)
+    
+    def team_changed(self):
+        """
+        Whether the team fields differ from what was loaded or last saved.
+
+        Instances without a snapshot (new, or loaded with team fields
+        deferred) are treated as changed.
+        """
+        loaded = getattr(self, '_loaded_team_ids', None)
+        return loaded is None or loaded != self.team_ids()
+    
     def save(self, *args, **kwargs):
         """Override save to handle status transitions."""
         if self.pk:
-            old_instance = Project.objects.get(pk=self.pk)
+            old_status = getattr(self, '_loaded_status', None)
+            if old_status is None:
+                # Only the previous status is needed, not the whole row.
+                old_status = Project.objects.filter(pk=self.pk).values_list('status', flat=True).first()
+            
+            # One clock read per save, shared by every date set below
+            now = timezone.now()
+            today = now.date()
             
             # Set actual start date when project moves from PLANNING to IN_PROGRESS
-            if (old_instance.status != ProjectStatus.IN_PROGRESS and 
+            if (old_status != ProjectStatus.IN_PROGRESS and 
                 self.status == ProjectStatus.IN_PROGRESS and 
                 not self.actual_start_date):
-                self.actual_start_date = timezone.now().date()
+                self.actual_start_date = today
             
             # Set actual end date when project is completed
-            if (old_instance.status != ProjectStatus.COMPLETED and 
+            if (old_status != ProjectStatus.COMPLETED and 
                 self.status == ProjectStatus.COMPLETED and 
                 not self.actual_end_date):
-                self.actual_end_date = timezone.now().date()
+                self.actual_end_date = today
                 
-                # Complete all open milestones
-                self.milestones.filter(status__in=[
-                    MilestoneStatus.NOT_STARTED,
-                    MilestoneStatus.IN_PROGRESS,
-                    MilestoneStatus.ON_HOLD
-                ]).update(
+                # Complete all open milestones in a single UPDATE
+                closed = self.milestones.filter(status__in=OPEN_MILESTONE_STATUSES).update(
                     status=MilestoneStatus.COMPLETED,
-                    actual_end_date=timezone.now().date()
+                    actual_end_date=today,
+                    updated_at=now
                 )
+                if closed:
+                    Project.objects.filter(pk=self.pk).update(
+                        milestones_completed=F('milestones_completed') + closed
+                    )
+                    self.milestones_completed += closed
         
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            # The counters only move through F() updates; writing this
+            # instance's copy back could undo concurrent milestone changes.
+            deferred = self.get_deferred_fields()
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.name not in MILESTONE_COUNTER_FIELDS
+                and field.attname not in deferred
+            ]
         super().save(*args, **kwargs)
+        _remember_saved_status(self, kwargs.get('update_fields'))
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or PROJECT_TEAM_FIELDS.intersection(update_fields):
+            self._loaded_team_ids = self.team_ids()
     
     @builtin_property
     def progress_percentage(self):
         """Calculate the project's progress percentage based on completed milestones."""
-        if not self.milestones.exists():
+        if not self.milestones_total:
             return 0
-            
-        total_milestones = self.milestones.count()
-        completed_milestones = self.milestones.filter(
-            status=MilestoneStatus.COMPLETED
-        ).count()
         
-        return round((completed_milestones / total_milestones) * 100, 2)
+        return round((self.milestones_completed / self.milestones_total) * 100, 2)
     
     @builtin_property
     def is_behind_schedule(self):
         """Check if the project is behind schedule."""
+        if '_is_behind_schedule' in self.__dict__:
+            return self._is_behind_schedule
+        
         if not self.planned_end_date or not self.actual_start_date:
             return False
             
@@ -244,10 +442,16 @@ class Project(models.Model):
     @builtin_property
     def budget_utilization(self):
         """Calculate the percentage of budget utilized."""
-        if self.estimated_budget == 0:
-            return 0
-            
-        return round((self.actual_cost / self.estimated_budget) * 100, 2)
+        if '_budget_utilization' in self.__dict__:
+            return self._budget_utilization
+        
+        # Work in whole cents and round half away from zero like the SQL
+        # Round() in with_metrics(), so both paths return the same Decimal.
+        budget_cents = round(self.estimated_budget * 100)
+        if budget_cents == 0:
+            return Decimal('0')
+        actual_cents = round(self.actual_cost * 100)
+        return (Decimal(actual_cents) * 100 / budget_cents).quantize(CENTS, rounding=ROUND_HALF_UP)
     
     def update_progress(self):
         """Update project progress based on milestones and tasks."""
@@ -255,15 +459,95 @@ class Project(models.Model):
         if self.status == ProjectStatus.COMPLETED:
             return
             
-        # Check if all milestones are completed
-        all_milestones_completed = not self.milestones.exclude(
-            status=MilestoneStatus.COMPLETED
-        ).exists()
+        # Check if all milestones are completed; the counters may have moved
+        # since this instance was loaded.
+        self.refresh_from_db(fields=sorted(MILESTONE_COUNTER_FIELDS))
+        all_milestones_completed = self.milestones_completed == self.milestones_total
         
         if all_milestones_completed and self.status != ProjectStatus.COMPLETED:
             self.status = ProjectStatus.COMPLETED
             self.actual_end_date = timezone.now().date()
-            self.save()
+            self.save(update_fields=['status', 'actual_end_date', 'updated_at'])
+
+
+class ProjectMembershipRole(models.TextChoices):
+    """Roles through which a user belongs to a project team."""
+    PROJECT_MANAGER = 'project_manager', _('Project Manager')
+    SITE_SUPERVISOR = 'site_supervisor', _('Site Supervisor')
+    CONTRACTOR = 'contractor', _('Contractor')
+    CLIENT = 'client', _('Client')
+
+
+class ProjectMembership(models.Model):
+    """
+    Denormalized project team membership.
+
+    Mirrors the project manager, site supervisor, contractors and client of a
+    project so access checks are a single indexed lookup. Rows are kept in
+    sync by signal handlers; do not edit them directly. Team fields written
+    with ``Project.objects...update()`` are re-synced by ProjectQuerySet.update();
+    raw SQL or ``_base_manager`` writes bypass both and must call
+    ``sync_for_project`` themselves.
+    """
+    project = models.ForeignKey(
+        Project,
+        on_delete=models.CASCADE,
+        related_name='memberships',
+        verbose_name=_('project')
+    )
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='project_memberships',
+        verbose_name=_('user')
+    )
+    role = models.CharField(
+        _('role'),
+        max_length=20,
+        choices=ProjectMembershipRole.choices
+    )
+
+    class Meta:
+        verbose_name = _('project membership')
+        verbose_name_plural = _('project memberships')
+        constraints = [
+            models.UniqueConstraint(
+                fields=['project', 'user', 'role'],
+                name='unique_project_membership_role'
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} -> {self.project_id} ({self.role})"
+
+    @classmethod
+    def sync_for_project(cls, project):
+        """Bring the membership rows for ``project`` in line with its team fields."""
+        desired = set()
+        if project.project_manager_id:
+            desired.add((project.project_manager_id, ProjectMembershipRole.PROJECT_MANAGER))
+        if project.site_supervisor_id:
+            desired.add((project.site_supervisor_id, ProjectMembershipRole.SITE_SUPERVISOR))
+        for contractor_id in project.contractors.values_list('id', flat=True):
+            desired.add((contractor_id, ProjectMembershipRole.CONTRACTOR))
+        if project.construction_request_id:
+            client_id = project.construction_request.client_id
+            if client_id:
+                desired.add((client_id, ProjectMembershipRole.CLIENT))
+
+        existing = set(cls.objects.filter(project=project).values_list('user_id', 'role'))
+        stale = existing - desired
+        if stale:
+            stale_filter = Q()
+            for user_id, role in stale:
+                stale_filter |= Q(user_id=user_id, role=role)
+            cls.objects.filter(project=project).filter(stale_filter).delete()
+        missing = desired - existing
+        if missing:
+            cls.objects.bulk_create(
+                [cls(project=project, user_id=user_id, role=role) for user_id, role in missing],
+                ignore_conflicts=True,
+            )
 
 
 class MilestoneStatus(models.TextChoices):
@@ -275,6 +559,16 @@ class MilestoneStatus(models.TextChoices):
     CANCELLED = 'CANCELLED', _('Cancelled')
 
 
+_MILESTONE_STATUS_DISPLAY = dict(MilestoneStatus.choices)
+
+# Milestones closed automatically when their project completes.
+OPEN_MILESTONE_STATUSES = (
+    MilestoneStatus.NOT_STARTED,
+    MilestoneStatus.IN_PROGRESS,
+    MilestoneStatus.ON_HOLD,
+)
+
+
 class ProjectDocumentType(models.TextChoices):
     PLAN = 'PLAN', _('Architectural Plan')
     PERMIT = 'PERMIT', _('Permit')
@@ -561,6 +855,36 @@ class ProjectMessageReceipt(models.Model):
 
 
 
+class ProjectMilestoneQuerySet(models.QuerySet):
+    def with_related(self):
+        """Join the project and author, and prefetch dependencies, for milestone listings."""
+        return self.select_related('project', 'created_by').prefetch_related('depends_on')
+    
+    def dependencies_of(self, milestone):
+        """
+        Milestones ``milestone`` depends on, directly or transitively.
+
+        The closure is computed by one recursive CTE over the ``depends_on``
+        link table instead of one query per level; UNION stops on cycles.
+        """
+        through = self.model.depends_on.through
+        table = connection.ops.quote_name(through._meta.db_table)
+        source = connection.ops.quote_name(through._meta.get_field('from_projectmilestone').column)
+        target = connection.ops.quote_name(through._meta.get_field('to_projectmilestone').column)
+        closure = RawSQL(
+            f"""
+            WITH RECURSIVE closure(id) AS (
+                SELECT {target} FROM {table} WHERE {source} = %s
+                UNION
+                SELECT link.{target} FROM {table} link JOIN closure ON link.{source} = closure.id
+            )
+            SELECT id FROM closure
+            """,
+            (milestone.pk,),
+        )
+        return self.filter(pk__in=closure)
+
+
 class ProjectMilestone(models.Model):
     """Model representing a milestone in a construction project."""
     project = models.ForeignKey(
@@ -630,10 +954,17 @@ class ProjectMilestone(models.Model):
         verbose_name=_('created by')
     )
     
+    objects = ProjectMilestoneQuerySet.as_manager()
+    
     class Meta:
         verbose_name = _('project milestone')
         verbose_name_plural = _('project milestones')
         ordering = ['project', 'planned_start_date']
+        indexes = [
+            # Milestone counts and the open-milestone close in Project.save().
+            models.Index(fields=['project', 'status'], name='milestone_project_status_idx'),
+            models.Index(fields=['project', 'planned_start_date'], name='milestone_project_start_idx'),
+        ]
         constraints = [
             models.UniqueConstraint(
                 fields=['project', 'title'],
@@ -646,58 +977,121 @@ class ProjectMilestone(models.Model):
         ]
     
     def __str__(self):
-        return f"{self.title} - {self.get_status_display()}"
+        return f"{self.title} - {_MILESTONE_STATUS_DISPLAY.get(self.status, self.status)}"
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored status so save() can detect transitions without a SELECT,
+        # and the project so the counter receivers can tell when a milestone moves.
+        if 'status' in field_names:
+            instance._loaded_status = instance.status
+        if 'project_id' in field_names:
+            instance._loaded_project_id = instance.project_id
+        return instance
+    
+    def loaded_state(self):
+        """The (status, project_id) last loaded or saved, or None when unknown."""
+        try:
+            return self._loaded_status, self._loaded_project_id
+        except AttributeError:
+            return None
     
     def clean(self):
         """Validate milestone data."""
         super().clean()
         
         # Validate dates against project dates
-        if self.planned_start_date and self.project.planned_start_date:
-            if self.planned_start_date < self.project.planned_start_date:
+        if not (self.planned_start_date or self.planned_end_date):
+            return
+        project_start, project_end = self._project_dates()
+        
+        if self.planned_start_date and project_start:
+            if self.planned_start_date < project_start:
                 raise ValidationError({
                     'planned_start_date': 'Cannot be before project start date.'
                 })
                 
-        if self.planned_end_date and self.project.planned_end_date:
-            if self.planned_end_date > self.project.planned_end_date:
+        if self.planned_end_date and project_end:
+            if self.planned_end_date > project_end:
                 raise ValidationError({
                     'planned_end_date': 'Cannot be after project end date.'
                 })
         
-        # Validate that dependencies are from the same project
-        if self.pk:  # Only check if this is an existing instance
-            invalid_deps = self.depends_on.exclude(project=self.project)
-            if invalid_deps.exists():
-                raise ValidationError({
-                    'depends_on': 'All dependencies must be from the same project.'
-                })
+        # Dependencies are checked against the project when they are added
+        # (see validate_milestone_dependencies), so the stored set is always
+        # valid and needs no query here.
+    
+    def _project_dates(self):
+        """The project's planned (start, end) dates, without loading the whole project."""
+        if self._meta.get_field('project').is_cached(self):
+            return self.project.planned_start_date, self.project.planned_end_date
+        if self.project_id is None:
+            return None, None
+        return Project.objects.filter(pk=self.project_id).values_list(
+            'planned_start_date', 'planned_end_date'
+        ).first() or (None, None)
     
     def save(self, *args, **kwargs):
         """Override save to handle status transitions and dependencies."""
         is_new = self._state.adding
         
         if not is_new:
-            old_instance = ProjectMilestone.objects.get(pk=self.pk)
+            old_status = getattr(self, '_loaded_status', None)
+            if old_status is None:
+                old_status = ProjectMilestone.objects.filter(pk=self.pk).values_list('status', flat=True).first()
+            
+            today = timezone.now().date()
             
             # Set actual start date when milestone is started
-            if (old_instance.status != MilestoneStatus.IN_PROGRESS and 
+            if (old_status != MilestoneStatus.IN_PROGRESS and 
                 self.status == MilestoneStatus.IN_PROGRESS and 
                 not self.actual_start_date):
-                self.actual_start_date = timezone.now().date()
+                self.actual_start_date = today
             
             # Set actual end date when milestone is completed
-            if (old_instance.status != MilestoneStatus.COMPLETED and 
+            if (old_status != MilestoneStatus.COMPLETED and 
                 self.status == MilestoneStatus.COMPLETED):
-                self.actual_end_date = timezone.now().date()
+                self.actual_end_date = today
                 self.completion_percentage = 100
         
         super().save(*args, **kwargs)
+        update_fields = kwargs.get('update_fields')
+        _remember_saved_status(self, update_fields)
+        if update_fields is None or {'project', 'project_id'}.intersection(update_fields):
+            self._loaded_project_id = self.project_id
         
         # Update project status if needed
-        if self.status == MilestoneStatus.IN_PROGRESS and self.project.status != ProjectStatus.IN_PROGRESS:
-            self.project.status = ProjectStatus.IN_PROGRESS
-            self.project.save()
+        if self.status == MilestoneStatus.IN_PROGRESS:
+            self._start_project()
+    
+    def _start_project(self):
+        """
+        Move the project to IN_PROGRESS when one of its milestones starts.
+
+        Only the columns the transition touches are loaded, under a row lock
+        so concurrent milestone starts don't both run it. Project.save()
+        fills in actual_start_date and sends post_save with these update_fields.
+        """
+        transition_fields = ['status', 'actual_start_date', 'updated_at']
+        with transaction.atomic():
+            project = (
+                Project.objects.select_for_update()
+                .only('id', *transition_fields)
+                .filter(pk=self.project_id)
+                .exclude(status=ProjectStatus.IN_PROGRESS)
+                .first()
+            )
+            if project is None:
+                return
+            project.status = ProjectStatus.IN_PROGRESS
+            project.save(update_fields=transition_fields)
+        
+        # Keep an already loaded self.project in step with the row.
+        if self._meta.get_field('project').is_cached(self):
+            for field in transition_fields:
+                setattr(self.project, field, getattr(project, field))
+            self.project._loaded_status = project.status
     
     @property
     def is_on_track(self):
@@ -726,9 +1120,11 @@ class ProjectMilestone(models.Model):
     
     def can_start(self):
         """Check if all dependencies are completed."""
-        if not self.depends_on.exists():
-            return True
-            
+        prefetched = getattr(self, '_prefetched_objects_cache', {}).get('depends_on')
+        if prefetched is not None:
+            return all(dependency.status == MilestoneStatus.COMPLETED for dependency in prefetched)
+        
+        # No dependencies means nothing is left open, so one EXISTS covers both cases.
         return not self.depends_on.exclude(
             status=MilestoneStatus.COMPLETED
         ).exists()
@@ -1,4 +1,9 @@
-from django.db import models
+import json
+from builtins import property as builtin_property
+from decimal import Decimal
+
+from django.db import connection, models, transaction
+from django.db.models.functions import Cast
 from django.utils.translation import gettext_lazy as _
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils import timezone
@@ -6,7 +11,33 @@ from django.core.exceptions import ValidationError
 
 from accounts.models import User
 from properties.models import Property
-from construction.ghana.models import EcoFeature
+from construction.ghana.models import EcoFeature, GhanaPricing, GhanaRegion
+
+CENTS = Decimal('0.01')
+
+# Upper bound on how long a queued estimate recompute is reported as pending.
+COST_RECOMPUTE_TIMEOUT = 60 * 10
+
+
+def cost_recompute_cache_key(construction_request_id):
+    """Cache key flagging a queued or running estimate recompute for a request."""
+    return f'construction:cost-recompute:{construction_request_id}'
+
+
+def _jsonb_set_key(field_name, key, value):
+    """
+    Postgres expression replacing one top-level key of a JSONB column.
+
+    Only the key and its value are sent to the database, not the whole document.
+    """
+    return models.Func(
+        models.F(field_name),
+        models.Func(models.Value(key), template='ARRAY[%(expressions)s]::text[]'),
+        Cast(models.Value(json.dumps(value)), models.JSONField()),
+        models.Value(True),
+        function='jsonb_set',
+        output_field=models.JSONField(),
+    )
 
 
 class ConstructionType(models.TextChoices):
@@ -164,6 +195,11 @@ class ConstructionRequest(models.Model):
         verbose_name = _('construction request')
         verbose_name_plural = _('construction requests')
         ordering = ['-created_at']
+        indexes = [
+            # Owner-scoped listings filtered by status or wizard step.
+            models.Index(fields=['client', 'status'], name='cr_client_status_idx'),
+            models.Index(fields=['client', 'current_step'], name='cr_client_step_idx'),
+        ]
 
     def __str__(self):
         return f"{self.title} - {self.get_construction_type_display()}"
@@ -176,28 +212,82 @@ class ConstructionRequest(models.Model):
             self.customization_data = {}
         self.customization_data[step] = data
         self.current_step = step
-        self.save()
+        if connection.vendor != 'postgresql':
+            self.save()
+            return
+        # Patch just this step's key instead of rewriting the whole JSON blob.
+        self.updated_at = timezone.now()
+        type(self).objects.filter(pk=self.pk).update(
+            customization_data=_jsonb_set_key('customization_data', step, data),
+            current_step=step,
+            updated_at=self.updated_at,
+        )
+
+    @builtin_property
+    def ghana_region(self):
+        """
+        The GhanaRegion matching ``region``, or None.
+
+        Memoized on the instance (and re-resolved if ``region`` changes) so the
+        cost and document helpers share one lookup per request object.
+        """
+        cached = self.__dict__.get('_ghana_region')
+        if cached is None or cached[0] != self.region:
+            cached = (self.region, GhanaRegion.get_by_name(self.region))
+            self.__dict__['_ghana_region'] = cached
+        return cached[1]
 
     def update_estimated_cost(self):
         """Update the estimated cost based on selected eco-features and regional pricing."""
-        from construction.ghana.models import GhanaRegion
-        if not self.region:
+        # Resolved before taking the lock to keep it short.
+        if self.ghana_region is None:
             return None
-        try:
-            region = GhanaRegion.objects.get(name=self.region)
-            base_cost = float(self.budget or 0)
-            total_cost = base_cost
-            eco_features = self.eco_features.all() if hasattr(self, 'eco_features') else []
-            for feature in eco_features:
-                feature_cost = float(feature.base_cost or 0)
-                if feature.category in region.cost_multipliers:
-                    feature_cost *= region.cost_multipliers[feature.category]
-                total_cost += feature_cost
+        with transaction.atomic():
+            # Concurrent recomputes for the same request queue up here instead of
+            # overwriting each other; no_key leaves FK inserts referencing the row unblocked.
+            budget = (
+                type(self).objects.select_for_update(no_key=True)
+                .filter(pk=self.pk)
+                .values_list('budget', flat=True)
+                .get()
+            )
+            # Selection rows already carry regionally priced costs.
+            feature_costs = self.selected_eco_features.aggregate(
+                total=models.Sum('estimated_cost')
+            )['total'] or Decimal('0')
+            total_cost = ((budget or Decimal('0')) + feature_costs).quantize(CENTS)
+            self.budget = budget
             self.estimated_cost = total_cost
-            self.save()
-            return total_cost
-        except GhanaRegion.DoesNotExist:
-            return None
+            self.save(update_fields=['estimated_cost', 'updated_at'])
+        return total_cost
+
+    def generate_specification_document(self):
+        """
+        Render the PDF specification for this request and store it as a document.
+
+        Returns:
+            ConstructionDocument: The document record pointing at the stored PDF.
+        """
+        from django.core.files.base import ContentFile
+        from construction.document_generator import (
+            generate_document_filename,
+            render_specification_pdf,
+        )
+
+        pdf_bytes = render_specification_pdf(self)
+        document = ConstructionDocument(
+            construction_request=self,
+            document_type=ConstructionDocument.DocumentType.OTHER,
+            title=f"Specification - {self.title}",
+            uploaded_by=self.client,
+        )
+        document.file.save(
+            generate_document_filename(self, 'specification'),
+            ContentFile(pdf_bytes),
+            save=False,
+        )
+        document.save()
+        return document
 
 
 class ConstructionMilestone(models.Model):
@@ -318,23 +408,132 @@ class ConstructionRequestEcoFeature(models.Model):
     def __str__(self):
         return f"{self.construction_request.title} - {self.eco_feature.name}"
 
+    @classmethod
+    def replace_for_request(cls, construction_request, selections):
+        """
+        Replace the eco-feature selections of ``construction_request``.
+
+        ``selections`` are dicts with an ``id`` (EcoFeature pk) plus optional
+        ``quantity`` and ``custom_specifications``; unknown or repeated ids are
+        skipped. Existing rows are diffed against the selections so unchanged
+        rows are left alone, changed rows go out in one bulk_update, new ones
+        in one bulk_create and dropped ones in one DELETE. Returns the rows in
+        selection order.
+        """
+        wanted = {}
+        for selection in selections:
+            feature_id = str(selection.get('id') or '')
+            if feature_id and feature_id not in wanted:
+                wanted[feature_id] = selection
+
+        features = {str(pk): feature for pk, feature in EcoFeature.objects.in_bulk(list(wanted)).items()}
+        unit_prices = cls._unit_prices(construction_request, [feature.pk for feature in features.values()])
+
+        with transaction.atomic():
+            existing = {
+                row.eco_feature_id: row
+                for row in construction_request.selected_eco_features.all()
+            }
+            rows, to_create, to_update = [], [], []
+            now = timezone.now()
+            for feature_id, selection in wanted.items():
+                eco_feature = features.get(feature_id)
+                if eco_feature is None:
+                    continue
+                quantity = int(selection.get('quantity') or 1)
+                custom_specifications = selection.get('custom_specifications') or ''
+                estimated_cost = cls._line_cost(unit_prices.get(eco_feature.pk), quantity)
+                row = existing.pop(eco_feature.pk, None)
+                if row is None:
+                    row = cls(
+                        construction_request=construction_request,
+                        eco_feature=eco_feature,
+                        quantity=quantity,
+                        custom_specifications=custom_specifications,
+                        estimated_cost=estimated_cost,
+                    )
+                    to_create.append(row)
+                elif (row.quantity, row.custom_specifications, row.estimated_cost) != (
+                    quantity, custom_specifications, estimated_cost
+                ):
+                    row.quantity = quantity
+                    row.custom_specifications = custom_specifications
+                    row.estimated_cost = estimated_cost
+                    # bulk_update bypasses auto_now.
+                    row.updated_at = now
+                    to_update.append(row)
+                rows.append(row)
+
+            if existing:
+                cls.objects.filter(pk__in=[row.pk for row in existing.values()]).delete()
+            if to_update:
+                cls.objects.bulk_update(
+                    to_update,
+                    ['quantity', 'custom_specifications', 'estimated_cost', 'updated_at'],
+                )
+            if to_create:
+                cls.objects.bulk_create(to_create)
+        return rows
+
+    @staticmethod
+    def _unit_prices(construction_request, eco_feature_ids):
+        """Map eco-feature ids to their regionally adjusted Decimal unit price (one query)."""
+        region = construction_request.ghana_region
+        if region is None or not eco_feature_ids:
+            return {}
+        pricing = GhanaPricing.objects.filter(
+            region=region,
+            eco_feature_id__in=eco_feature_ids,
+            is_active=True,
+        )
+        # Stay in Decimal end to end; the columns are already decimals.
+        return {
+            eco_feature_id: base_price * region.cost_multiplier
+            for eco_feature_id, base_price in pricing.values_list('eco_feature_id', 'base_price')
+        }
+
+    @staticmethod
+    def _line_cost(unit_price, quantity):
+        if unit_price is None:
+            return None
+        return (unit_price * quantity).quantize(CENTS)
+
+    @classmethod
+    def recalculate_for_request(cls, construction_request):
+        """
+        Re-price every selection of ``construction_request`` for its current region.
+
+        Rows and prices are loaded with one query each and only rows whose
+        cost changed are written, in a single bulk_update.
+        """
+        rows = list(cls.objects.filter(construction_request=construction_request).order_by())
+        unit_prices = cls._unit_prices(construction_request, [row.eco_feature_id for row in rows])
+        now = timezone.now()
+        changed = []
+        for row in rows:
+            estimated_cost = cls._line_cost(unit_prices.get(row.eco_feature_id), row.quantity)
+            if row.estimated_cost != estimated_cost:
+                row.estimated_cost = estimated_cost
+                row.updated_at = now
+                changed.append(row)
+        if changed:
+            cls.objects.bulk_update(changed, ['estimated_cost', 'updated_at'], batch_size=500)
+        return changed
+
     def calculate_estimated_cost(self):
         """Calculate the estimated cost based on quantity and regional pricing."""
-        if not self.construction_request.region:
+        region = self.construction_request.ghana_region
+        if region is None:
             return None
-        
         try:
-            from construction.ghana.models import GhanaPricing, GhanaRegion
-            region = GhanaRegion.objects.get(name=self.construction_request.region)
             pricing = GhanaPricing.objects.get(
                 region=region,
                 eco_feature=self.eco_feature,
                 is_active=True
             )
-            base_cost = pricing.get_adjusted_price()
-            total_cost = base_cost * self.quantity
+            total_cost = self._line_cost(pricing.base_price * region.cost_multiplier, self.quantity)
             self.estimated_cost = total_cost
-            self.save()
+            self.save(update_fields=['estimated_cost', 'updated_at'])
             return total_cost
-        except (GhanaRegion.DoesNotExist, GhanaPricing.DoesNotExist):
+        except GhanaPricing.DoesNotExist:
             return None
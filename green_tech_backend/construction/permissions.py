@@ -7,6 +7,7 @@ from django.shortcuts import get_object_or_404
 from .models import (
     ConstructionRequest, 
     Project,
+    ProjectMembership,
     ProjectMilestone,
     # Quote models now handled by quotes app
     ProjectStatus,
@@ -50,14 +51,9 @@ class IsProjectTeamMember(permissions.BasePermission):
             return True
         if project.project_manager_id == user.id:
             return True
-        if getattr(project, 'site_supervisor_id', None) == user.id:
-            return True
-        if project.contractors.filter(id=user.id).exists():
-            return True
-        client = getattr(getattr(project, 'construction_request', None), 'client', None)
-        if client and client.id == user.id:
-            return True
-        return False
+        # Contractors and the client are resolved from the denormalized
+        # membership table rather than joining through each relation.
+        return ProjectMembership.objects.filter(project_id=project.pk, user_id=user.id).exists()
 
     def has_object_permission(self, request, view, obj):
         project = self._resolve_project(obj)
@@ -188,8 +184,8 @@ class CanEditConstructionRequest(permissions.BasePermission):
             
         # Write permissions are only allowed to the client, project manager, or admin
         return (
-            obj.client == request.user or
-            obj.project_manager == request.user or
+            obj.client_id == request.user.pk or
+            obj.project_manager_id == request.user.pk or
             request.user.is_staff
         )
 
@@ -52,3 +52,29 @@ def broadcast_read_receipt(message, user_id, read_at=None):
             },
         },
     )
+
+
+def broadcast_document_ready(project_id, payload: dict):
+    layer = get_channel_layer()
+    if not layer:
+        return
+    async_to_sync(layer.group_send)(
+        GROUP_TEMPLATE.format(project_id=project_id),
+        {
+            'type': 'document.ready',
+            'payload': payload,
+        },
+    )
+
+
+def broadcast_cost_update(project_id, payload: dict):
+    layer = get_channel_layer()
+    if not layer:
+        return
+    async_to_sync(layer.group_send)(
+        GROUP_TEMPLATE.format(project_id=project_id),
+        {
+            'type': 'construction.cost',
+            'payload': payload,
+        },
+    )
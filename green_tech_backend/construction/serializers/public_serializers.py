@@ -5,6 +5,20 @@ from rest_framework import serializers
 from construction.models import Project, ProjectStatus
 
 
+# Keyword tables for the category helpers, built once at import rather than
+# on each of the several get_category() calls made per serialized project.
+PROPERTY_TYPE_CATEGORIES = (
+    ('residential', ('residential', 'house', 'apartment')),
+    ('commercial', ('commercial', 'office', 'shop')),
+    ('industrial', ('industrial', 'factory', 'warehouse')),
+)
+TEXT_CATEGORIES = (
+    ('residential', ('house', 'home', 'residential', 'apartment', 'villa')),
+    ('commercial', ('office', 'commercial', 'shop', 'retail', 'business')),
+    ('industrial', ('factory', 'industrial', 'warehouse', 'manufacturing')),
+)
+
+
 class PublicProjectSerializer(serializers.ModelSerializer):
     """
     Public serializer for project display on the frontend website.
@@ -29,28 +43,30 @@ class PublicProjectSerializer(serializers.ModelSerializer):
     
     def get_category(self, obj):
         """Determine project category based on property type or project characteristics."""
+        # image/units/features all derive from the category; compute it once per object.
+        category = getattr(obj, '_public_category', None)
+        if category is None:
+            category = obj._public_category = self._resolve_category(obj)
+        return category
+    
+    @staticmethod
+    def _resolve_category(obj):
         # Try to get category from construction request property if available
         if obj.construction_request and hasattr(obj.construction_request, 'property') and obj.construction_request.property:
             property_obj = obj.construction_request.property
             if hasattr(property_obj, 'property_type'):
                 property_type = property_obj.property_type.lower()
-                if 'residential' in property_type or 'house' in property_type or 'apartment' in property_type:
-                    return 'residential'
-                elif 'commercial' in property_type or 'office' in property_type or 'shop' in property_type:
-                    return 'commercial'
-                elif 'industrial' in property_type or 'factory' in property_type or 'warehouse' in property_type:
-                    return 'industrial'
+                for category, keywords in PROPERTY_TYPE_CATEGORIES:
+                    if any(keyword in property_type for keyword in keywords):
+                        return category
         
         # Fallback: determine from title/description
         title_lower = obj.title.lower()
         desc_lower = obj.description.lower()
         
-        if any(keyword in title_lower or keyword in desc_lower for keyword in ['house', 'home', 'residential', 'apartment', 'villa']):
-            return 'residential'
-        elif any(keyword in title_lower or keyword in desc_lower for keyword in ['office', 'commercial', 'shop', 'retail', 'business']):
-            return 'commercial'
-        elif any(keyword in title_lower or keyword in desc_lower for keyword in ['factory', 'industrial', 'warehouse', 'manufacturing']):
-            return 'industrial'
+        for category, keywords in TEXT_CATEGORIES:
+            if any(keyword in title_lower or keyword in desc_lower for keyword in keywords):
+                return category
         
         return 'commercial'  # Default category
     
@@ -2,6 +2,8 @@
 Serializers for construction request models.
 """
 from rest_framework import serializers
+from django.core.cache import cache
+from django.db.models import Prefetch
 from django.utils.translation import gettext_lazy as _
 from accounts.serializers import UserSerializer
 from properties.serializers import PropertyDetailSerializer
@@ -11,6 +13,7 @@ from ..models import (
     ConstructionDocument, Project, ProjectStatus,
     ConstructionRequestEcoFeature, ConstructionRequestStep
 )
+from ..models.request import cost_recompute_cache_key
 
 
 class ConstructionMilestoneSerializer(serializers.ModelSerializer):
@@ -87,6 +90,7 @@ class ConstructionRequestSerializer(serializers.ModelSerializer):
     milestones = ConstructionMilestoneSerializer(many=True, read_only=True)
     documents = ConstructionDocumentSerializer(many=True, read_only=True)
     property_data = PropertyDetailSerializer(source='property', read_only=True)
+    cost_status = serializers.SerializerMethodField()
     
     class Meta:
         model = ConstructionRequest
@@ -95,13 +99,35 @@ class ConstructionRequestSerializer(serializers.ModelSerializer):
             'status', 'status_display', 'current_step', 'current_step_display',
             'is_completed', 'customization_data', 'property', 'property_data', 
             'address', 'city', 'region', 'start_date', 'estimated_end_date', 
-            'actual_end_date', 'budget', 'currency', 'estimated_cost', 
+            'actual_end_date', 'budget', 'currency', 'estimated_cost', 'cost_status',
             'target_energy_rating', 'target_water_rating', 'target_sustainability_score', 
             'client', 'project_manager', 'contractors', 'selected_eco_features',
             'milestones', 'documents', 'created_at', 'updated_at'
         ]
         read_only_fields = ('id', 'created_at', 'updated_at', 'estimated_cost')
     
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Load every relation this serializer renders, so lists don't query per row."""
+        return queryset.select_related(
+            'client', 'project_manager', 'property__region'
+        ).prefetch_related(
+            'contractors',
+            'milestones',
+            'documents',
+            'property__images',
+            Prefetch(
+                'selected_eco_features',
+                queryset=ConstructionRequestEcoFeature.objects.select_related('eco_feature'),
+            ),
+        )
+    
+    def get_cost_status(self, obj):
+        """'recomputing' while a queued estimate refresh is pending, else 'ready'."""
+        if cache.get(cost_recompute_cache_key(obj.pk)):
+            return 'recomputing'
+        return 'ready'
+    
     def validate(self, data):
         """
         Validate the construction request data based on the current step.
@@ -1,9 +1,15 @@
-﻿from django.db.models.signals import post_save, pre_save
+﻿from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
 from django.dispatch import receiver
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db.models import F
 
 from construction.models import (
+    ConstructionRequest,
     Project,
+    ProjectMembership,
+    ProjectMembershipRole,
     ProjectMilestone,
     ProjectDocumentVersion,
     ProjectUpdate,
@@ -11,6 +17,9 @@ from construction.models import (
     MilestoneStatus,
     ProjectTaskStatus
 )
+from construction.cache import invalidate_public_project_stats
+from construction.models.project import PROJECT_TEAM_FIELDS
+from construction.ghana.models import GhanaRegion
 from notifications.services import notify_users
 
 User = get_user_model()
@@ -29,16 +38,122 @@ def _project_recipients(project: Project) -> list[User]:
     return list(recipients)
 
 
+@receiver(post_save, sender=Project)
+def sync_project_memberships(sender, instance, created=False, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    if update_fields is not None and not PROJECT_TEAM_FIELDS.intersection(update_fields):
+        return
+    # Project.save() always passes update_fields, so compare against the team
+    # captured at load time rather than relying on the field list alone.
+    if not created and not instance.team_changed():
+        return
+    ProjectMembership.sync_for_project(instance)
+
+
+@receiver(m2m_changed, sender=Project.contractors.through)
+def sync_contractor_memberships(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in {'post_add', 'post_remove', 'post_clear'}:
+        return
+    if not reverse:
+        ProjectMembership.sync_for_project(instance)
+        return
+    # Changed from the user side: ``pk_set`` holds project ids, or is None
+    # when the user's contractor links were cleared.
+    if pk_set is None:
+        projects = Project.objects.filter(
+            memberships__user=instance,
+            memberships__role=ProjectMembershipRole.CONTRACTOR,
+        )
+    else:
+        projects = Project.objects.filter(pk__in=pk_set)
+    for project in projects:
+        ProjectMembership.sync_for_project(project)
+
+
+# Fields the public stats counts depend on (status, plus the keyword-matched
+# text behind the category filter).
+_PUBLIC_STATS_FIELDS = frozenset({'status', 'title', 'description'})
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+def expire_public_project_stats(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or (update_fields is not None and not _PUBLIC_STATS_FIELDS.intersection(update_fields)):
+        return
+    invalidate_public_project_stats()
+
+
+@receiver(post_save, sender=GhanaRegion)
+@receiver(post_delete, sender=GhanaRegion)
+def expire_cached_region(sender, instance, **kwargs):
+    cache.delete(GhanaRegion.cache_key(instance.name))
+
+
+@receiver(post_save, sender=ConstructionRequest)
+def sync_client_memberships(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or (update_fields is not None and 'client' not in update_fields):
+        return
+    for project in Project.objects.filter(construction_request=instance):
+        ProjectMembership.sync_for_project(project)
+
+
+@receiver(m2m_changed, sender=ProjectMilestone.depends_on.through)
+def validate_milestone_dependencies(sender, instance, action, reverse, pk_set, **kwargs):
+    """Reject dependencies on milestones from another project, in one query per add."""
+    if action != 'pre_add' or not pk_set:
+        return
+    # Either side of the link must share ``instance``'s project.
+    if ProjectMilestone.objects.filter(pk__in=pk_set).exclude(project_id=instance.project_id).exists():
+        raise ValidationError({
+            'depends_on': 'All dependencies must be from the same project.'
+        })
+
+
 @receiver(pre_save, sender=ProjectMilestone)
 def _store_previous_milestone_state(sender, instance, **kwargs):
+    previous = None
     if instance.pk:
-        try:
-            previous = sender.objects.get(pk=instance.pk)
-            instance._previous_status = previous.status
-        except sender.DoesNotExist:
-            instance._previous_status = None
+        # Loaded instances carry a snapshot; only query when there is none.
+        previous = instance.loaded_state() or (
+            sender.objects.filter(pk=instance.pk).values_list('status', 'project_id').first()
+        )
+    instance._previous_status, instance._previous_project_id = previous or (None, None)
+
+
+def _adjust_milestone_counters(project_id, total=0, completed=0):
+    if project_id is None or not (total or completed):
+        return
+    Project.objects.filter(pk=project_id).update(
+        milestones_total=F('milestones_total') + total,
+        milestones_completed=F('milestones_completed') + completed,
+    )
+
+
+@receiver(post_save, sender=ProjectMilestone)
+def count_saved_milestone(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    completed = int(instance.status == MilestoneStatus.COMPLETED)
+    if created:
+        _adjust_milestone_counters(instance.project_id, total=1, completed=completed)
+        return
+    previous_project_id = getattr(instance, '_previous_project_id', instance.project_id)
+    was_completed = int(getattr(instance, '_previous_status', None) == MilestoneStatus.COMPLETED)
+    if previous_project_id != instance.project_id:
+        _adjust_milestone_counters(previous_project_id, total=-1, completed=-was_completed)
+        _adjust_milestone_counters(instance.project_id, total=1, completed=completed)
     else:
-        instance._previous_status = None
+        _adjust_milestone_counters(instance.project_id, completed=completed - was_completed)
+
+
+@receiver(post_delete, sender=ProjectMilestone)
+def uncount_deleted_milestone(sender, instance, **kwargs):
+    _adjust_milestone_counters(
+        instance.project_id,
+        total=-1,
+        completed=-int(instance.status == MilestoneStatus.COMPLETED),
+    )
 
 
 @receiver(post_save, sender=ProjectMilestone)
@@ -1,3 +1,6 @@
 """Utility helpers for project task management."""
 
+from .costs import recompute_construction_cost  # noqa: F401
+from .documents import render_spec_pdf  # noqa: F401
+from .realtime import broadcast_project_message_task  # noqa: F401
 from .utils import build_project_tasks_ics, mark_overdue_tasks  # noqa: F401
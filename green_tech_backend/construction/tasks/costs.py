@@ -0,0 +1,45 @@
+"""Background tasks for construction request cost estimates."""
+from __future__ import annotations
+
+from celery import shared_task
+from django.core.cache import cache
+
+from construction.models import ConstructionRequest, ConstructionRequestEcoFeature
+from construction.models.request import cost_recompute_cache_key
+from construction.realtime import broadcast_cost_update
+
+
+@shared_task
+def recompute_construction_cost(construction_request_id: int, selections: list) -> str | None:
+    """Apply eco-feature selections, refresh the estimate and announce it on the project channel."""
+
+    try:
+        return _recompute_construction_cost(construction_request_id, selections)
+    finally:
+        # Clears the pending flag set by save_step, so polling clients see the new estimate.
+        cache.delete(cost_recompute_cache_key(construction_request_id))
+
+
+def _recompute_construction_cost(construction_request_id: int, selections: list) -> str | None:
+    construction_request = (
+        ConstructionRequest.objects.select_related('project')
+        .filter(pk=construction_request_id)
+        .first()
+    )
+    if construction_request is None:
+        return None
+    ConstructionRequestEcoFeature.replace_for_request(construction_request, selections)
+    estimated_cost = construction_request.update_estimated_cost()
+    # Decimals aren't serializable by the channel layer or the result backend.
+    if estimated_cost is not None:
+        estimated_cost = str(estimated_cost)
+    project = getattr(construction_request, 'project', None)
+    if project is not None:
+        broadcast_cost_update(
+            project.id,
+            {
+                'construction_request_id': construction_request.id,
+                'estimated_cost': estimated_cost,
+            },
+        )
+    return estimated_cost
@@ -0,0 +1,35 @@
+"""Background tasks for construction request documents."""
+from __future__ import annotations
+
+from celery import shared_task
+
+from construction.models import ConstructionRequest
+from construction.realtime import broadcast_document_ready
+
+
+@shared_task
+def render_spec_pdf(construction_request_id: int) -> int | None:
+    """Render a request's specification PDF and announce it on the project channel."""
+
+    construction_request = (
+        ConstructionRequest.objects.select_related('client', 'project_manager', 'property', 'project')
+        # The specification never renders the step payloads.
+        .defer('customization_data', 'description')
+        .filter(pk=construction_request_id)
+        .first()
+    )
+    if construction_request is None:
+        return None
+    document = construction_request.generate_specification_document()
+    project = getattr(construction_request, 'project', None)
+    if project is not None:
+        broadcast_document_ready(
+            project.id,
+            {
+                'construction_request_id': construction_request.id,
+                'document_id': document.id,
+                'title': document.title,
+                'url': document.file.url,
+            },
+        )
+    return document.id
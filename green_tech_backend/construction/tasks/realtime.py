@@ -0,0 +1,22 @@
+"""Background tasks for project chat realtime delivery."""
+from __future__ import annotations
+
+from celery import shared_task
+
+from construction.models import ProjectChatMessage
+from construction.realtime import broadcast_project_message
+
+
+@shared_task
+def broadcast_project_message_task(message_id: str) -> None:
+    """Reload a chat message and fan it out to the project's websocket group."""
+
+    message = (
+        ProjectChatMessage.objects.select_related('project', 'sender')
+        .prefetch_related('attachments', 'receipts__user')
+        .filter(pk=message_id)
+        .first()
+    )
+    if message is None:
+        return
+    broadcast_project_message(message)
@@ -0,0 +1,100 @@
+from decimal import Decimal
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from construction.ghana.models import EcoFeature, GhanaPricing, GhanaRegion
+from construction.models import ConstructionRequest, ConstructionRequestStep
+from construction.models.request import cost_recompute_cache_key
+from construction.tasks import recompute_construction_cost
+
+User = get_user_model()
+
+
+class RecomputeConstructionCostTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(email='client@example.com', password='testpass')
+        region = GhanaRegion.objects.create(
+            name=GhanaRegion.RegionName.GREATER_ACCRA,
+            capital='Accra',
+            cost_multiplier=Decimal('1.20'),
+        )
+        self.feature = EcoFeature.objects.create(
+            name='Rooftop solar', category=EcoFeature.FeatureCategory.SOLAR
+        )
+        GhanaPricing.objects.create(
+            region=region, eco_feature=self.feature, base_price=Decimal('1000.00')
+        )
+        self.construction_request = ConstructionRequest.objects.create(
+            title='Eco villa',
+            client=self.user,
+            region=GhanaRegion.RegionName.GREATER_ACCRA,
+            budget=Decimal('50000.00'),
+        )
+        self.selections = [{'id': self.feature.pk, 'quantity': 2}]
+        self.api_client = APIClient()
+        self.api_client.force_authenticate(self.user)
+        base = f'/api/construction/construction-requests/{self.construction_request.pk}'
+        self.detail_url = f'{base}/'
+        self.save_step_url = f'{base}/save_step/'
+
+    def _save_eco_features(self):
+        return self.api_client.post(
+            self.save_step_url,
+            {
+                'step': ConstructionRequestStep.ECO_FEATURES,
+                'data': {'selected_features': self.selections},
+            },
+            format='json',
+        )
+
+    def test_eager_task_persists_estimated_cost(self):
+        result = recompute_construction_cost.apply(
+            args=(self.construction_request.pk, self.selections)
+        )
+
+        # Budget plus 2 x 1000.00 priced at the 1.20 regional multiplier.
+        self.assertEqual(result.get(), '52400.00')
+        self.construction_request.refresh_from_db()
+        self.assertEqual(self.construction_request.estimated_cost, Decimal('52400.00'))
+        selection = self.construction_request.selected_eco_features.get()
+        self.assertEqual(selection.quantity, 2)
+        self.assertEqual(selection.estimated_cost, Decimal('2400.00'))
+
+    def test_task_clears_pending_flag(self):
+        key = cost_recompute_cache_key(self.construction_request.pk)
+        cache.set(key, True)
+
+        recompute_construction_cost.apply(args=(self.construction_request.pk, self.selections))
+
+        self.assertIsNone(cache.get(key))
+
+    def test_save_step_returns_recomputed_cost_when_task_ran(self):
+        def run_eagerly(*args, **kwargs):
+            return recompute_construction_cost.apply(args=args, kwargs=kwargs)
+
+        with mock.patch.object(recompute_construction_cost, 'delay', side_effect=run_eagerly):
+            response = self._save_eco_features()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['cost_status'], 'ready')
+        self.assertEqual(Decimal(response.data['estimated_cost']), Decimal('52400.00'))
+
+    def test_save_step_reports_pending_recompute_until_task_runs(self):
+        pending = mock.Mock(**{'ready.return_value': False})
+        with mock.patch.object(recompute_construction_cost, 'delay', return_value=pending) as delay:
+            response = self._save_eco_features()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['cost_status'], 'recomputing')
+        self.assertEqual(self.api_client.get(self.detail_url).data['cost_status'], 'recomputing')
+
+        recompute_construction_cost.apply(args=delay.call_args.args)
+
+        response = self.api_client.get(self.detail_url)
+        self.assertEqual(response.data['cost_status'], 'ready')
+        self.assertEqual(Decimal(response.data['estimated_cost']), Decimal('52400.00'))
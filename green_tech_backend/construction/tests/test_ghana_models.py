@@ -0,0 +1,25 @@
+from decimal import Decimal
+
+import pytest
+
+from construction.ghana.models import EcoFeature, GhanaPricing, GhanaRegion
+
+
+@pytest.mark.django_db()
+def test_adjusted_price_is_decimal_in_cents():
+    region = GhanaRegion.objects.create(
+        name=GhanaRegion.RegionName.ASHANTI,
+        capital='Kumasi',
+        cost_multiplier=Decimal('1.15'),
+    )
+    feature = EcoFeature.objects.create(name='Solar water heater', category=EcoFeature.FeatureCategory.SOLAR)
+    pricing = GhanaPricing.objects.create(region=region, eco_feature=feature, base_price=Decimal('333.33'))
+
+    adjusted = pricing.get_adjusted_price()
+
+    assert isinstance(adjusted, Decimal)
+    assert adjusted == Decimal('383.33')
+    annotated = GhanaPricing.objects.annotate(
+        adjusted=GhanaPricing.adjusted_price_expression()
+    ).get(pk=pricing.pk).adjusted
+    assert annotated.quantize(Decimal('0.01')) == adjusted
@@ -0,0 +1,29 @@
+from decimal import Decimal
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+
+from construction.ghana.models import GhanaRegion
+
+
+class LoadGhanaDataCommandTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_reload_expires_cached_regions(self):
+        region = GhanaRegion.objects.create(
+            pk=1,
+            name=GhanaRegion.RegionName.GREATER_ACCRA,
+            capital='Accra',
+            cost_multiplier=Decimal('9.99'),
+        )
+        self.assertEqual(GhanaRegion.get_by_name(region.name).cost_multiplier, Decimal('9.99'))
+
+        call_command('load_ghana_data', stdout=StringIO())
+
+        self.assertEqual(
+            GhanaRegion.get_by_name(GhanaRegion.RegionName.GREATER_ACCRA).cost_multiplier,
+            Decimal('1.30'),
+        )
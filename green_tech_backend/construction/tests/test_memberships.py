@@ -0,0 +1,114 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
+
+from construction.models import (
+    ConstructionRequest,
+    Project,
+    ProjectMembership,
+    ProjectMembershipRole,
+    ProjectStatus,
+)
+from locations.models import Region
+from properties.models import Property, PropertyType, ListingType
+
+User = get_user_model()
+
+
+class ProjectMembershipSyncTests(TestCase):
+    fixtures = ['locations/fixtures/default_regions.json']
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.property = Property.objects.create(
+            slug='eco-villa-plot',
+            title='Eco villa plot',
+            property_type=PropertyType.VILLA,
+            listing_type=ListingType.SALE,
+            price=Decimal('250000.00'),
+            area_sq_m=Decimal('180.00'),
+            city='Accra',
+            region=Region.objects.first(),
+        )
+
+    def setUp(self):
+        self.manager = User.objects.create_user(email='pm@example.com', password='testpass', is_staff=True)
+        self.other_manager = User.objects.create_user(email='pm2@example.com', password='testpass', is_staff=True)
+        self.supervisor = User.objects.create_user(email='sup@example.com', password='testpass', is_staff=True)
+        self.contractor = User.objects.create_user(email='con@example.com', password='testpass')
+        self.client_user = User.objects.create_user(email='client@example.com', password='testpass')
+        self.other_client = User.objects.create_user(email='client2@example.com', password='testpass')
+        self.request = ConstructionRequest.objects.create(title='Eco villa', client=self.client_user)
+        self.project = Project.objects.create(
+            title='Eco villa build',
+            project_manager=self.manager,
+            property=self.property,
+            created_by=self.manager,
+        )
+
+    def members(self, role):
+        return set(
+            ProjectMembership.objects.filter(project=self.project, role=role).values_list('user_id', flat=True)
+        )
+
+    def test_project_manager_granted_on_create_and_revoked_on_change(self):
+        self.assertEqual(self.members(ProjectMembershipRole.PROJECT_MANAGER), {self.manager.pk})
+
+        project = Project.objects.get(pk=self.project.pk)
+        project.project_manager = self.other_manager
+        project.save()
+
+        self.assertEqual(self.members(ProjectMembershipRole.PROJECT_MANAGER), {self.other_manager.pk})
+
+    def test_site_supervisor_grant_and_revoke(self):
+        project = Project.objects.get(pk=self.project.pk)
+        project.site_supervisor = self.supervisor
+        project.save()
+        self.assertEqual(self.members(ProjectMembershipRole.SITE_SUPERVISOR), {self.supervisor.pk})
+
+        project.site_supervisor = None
+        project.save()
+        self.assertEqual(self.members(ProjectMembershipRole.SITE_SUPERVISOR), set())
+
+    def test_contractor_grant_and_revoke(self):
+        self.project.contractors.add(self.contractor)
+        self.assertEqual(self.members(ProjectMembershipRole.CONTRACTOR), {self.contractor.pk})
+
+        self.project.contractors.remove(self.contractor)
+        self.assertEqual(self.members(ProjectMembershipRole.CONTRACTOR), set())
+
+    def test_client_grant_and_revoke(self):
+        project = Project.objects.get(pk=self.project.pk)
+        project.construction_request = self.request
+        project.save()
+        self.assertEqual(self.members(ProjectMembershipRole.CLIENT), {self.client_user.pk})
+
+        self.request.client = self.other_client
+        self.request.save()
+        self.assertEqual(self.members(ProjectMembershipRole.CLIENT), {self.other_client.pk})
+
+        project.construction_request = None
+        project.save()
+        self.assertEqual(self.members(ProjectMembershipRole.CLIENT), set())
+
+    def test_queryset_update_of_team_fields_resyncs(self):
+        Project.objects.filter(pk=self.project.pk).update(project_manager=self.other_manager)
+        self.assertEqual(self.members(ProjectMembershipRole.PROJECT_MANAGER), {self.other_manager.pk})
+
+        Project.objects.filter(pk=self.project.pk).update(site_supervisor_id=self.supervisor.pk)
+        self.assertEqual(self.members(ProjectMembershipRole.SITE_SUPERVISOR), {self.supervisor.pk})
+
+    def test_save_without_team_change_skips_sync(self):
+        project = Project.objects.get(pk=self.project.pk)
+        project.status = ProjectStatus.PLANNING
+
+        with CaptureQueriesContext(connection) as queries:
+            project.save()
+
+        self.assertFalse(
+            any('construction_projectmembership' in query['sql'] for query in queries.captured_queries)
+        )
+        self.assertEqual(self.members(ProjectMembershipRole.PROJECT_MANAGER), {self.manager.pk})
@@ -0,0 +1,220 @@
+import datetime
+from decimal import Decimal
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db.models.signals import post_save
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from construction.models import MilestoneStatus, Project, ProjectMilestone, ProjectStatus
+from locations.models import Region
+from properties.models import ListingType, Property, PropertyType
+
+User = get_user_model()
+
+
+class ProjectTestCase(TestCase):
+    fixtures = ['locations/fixtures/default_regions.json']
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.property = Property.objects.create(
+            slug='eco-villa-plot',
+            title='Eco villa plot',
+            property_type=PropertyType.VILLA,
+            listing_type=ListingType.SALE,
+            price=Decimal('250000.00'),
+            area_sq_m=Decimal('180.00'),
+            city='Accra',
+            region=Region.objects.first(),
+        )
+
+    def setUp(self):
+        self.manager = User.objects.create_user(email='pm@example.com', password='testpass', is_staff=True)
+        self.project = self.create_project()
+
+    def mute_notifications(self):
+        # Milestone receivers email the project team; these tests only track the rows.
+        patcher = mock.patch('construction.signals.notify_users')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def create_project(self, **kwargs):
+        kwargs.setdefault('title', 'Eco villa build')
+        return Project.objects.create(
+            project_manager=self.manager,
+            property=self.property,
+            created_by=self.manager,
+            **kwargs,
+        )
+
+
+class BudgetUtilizationTests(ProjectTestCase):
+    def assert_utilization(self, project, expected):
+        annotated = Project.objects.with_metrics().get(pk=project.pk)
+        for value in (project.budget_utilization, annotated.budget_utilization):
+            self.assertIsInstance(value, Decimal)
+            self.assertEqual(value, expected)
+
+    def test_property_matches_annotation(self):
+        self.project.estimated_budget = Decimal('3.00')
+        self.project.actual_cost = Decimal('1.00')
+        self.project.save()
+
+        self.assert_utilization(self.project, Decimal('33.33'))
+
+    def test_rounds_half_away_from_zero(self):
+        self.project.estimated_budget = Decimal('800.00')
+        self.project.actual_cost = Decimal('0.20')
+        self.project.save()
+
+        # 0.025% rounds up to 0.03 in SQL and in Python.
+        self.assert_utilization(self.project, Decimal('0.03'))
+
+    def test_zero_budget(self):
+        self.project.estimated_budget = Decimal('0')
+        self.project.actual_cost = Decimal('10.00')
+        self.project.save()
+
+        self.assert_utilization(self.project, Decimal('0'))
+
+
+class MilestoneStartTests(ProjectTestCase):
+    def setUp(self):
+        super().setUp()
+        self.mute_notifications()
+        self.receiver = mock.Mock()
+        post_save.connect(self.receiver, sender=Project)
+        self.addCleanup(post_save.disconnect, self.receiver, sender=Project)
+
+    def start_milestone(self, project, title='Foundations'):
+        return ProjectMilestone.objects.create(
+            project=project,
+            title=title,
+            status=MilestoneStatus.IN_PROGRESS,
+            planned_end_date=timezone.now().date() + datetime.timedelta(days=30),
+            created_by=self.manager,
+        )
+
+    def test_starting_milestone_starts_project(self):
+        milestone = self.start_milestone(Project.objects.get(pk=self.project.pk))
+
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.status, ProjectStatus.IN_PROGRESS)
+        self.assertEqual(self.project.actual_start_date, timezone.now().date())
+        # The cached project matches the row.
+        self.assertEqual(milestone.project.status, ProjectStatus.IN_PROGRESS)
+        self.assertEqual(milestone.project.actual_start_date, self.project.actual_start_date)
+
+        self.receiver.assert_called_once()
+        kwargs = self.receiver.call_args.kwargs
+        self.assertEqual(set(kwargs['update_fields']), {'status', 'actual_start_date', 'updated_at'})
+        self.assertEqual(kwargs['instance'].status, ProjectStatus.IN_PROGRESS)
+        self.assertFalse(kwargs['created'])
+
+    def test_keeps_existing_actual_start_date(self):
+        started = datetime.date(2024, 1, 15)
+        Project.objects.filter(pk=self.project.pk).update(actual_start_date=started)
+
+        self.start_milestone(self.project)
+
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.status, ProjectStatus.IN_PROGRESS)
+        self.assertEqual(self.project.actual_start_date, started)
+
+    def test_project_already_in_progress_is_left_alone(self):
+        self.start_milestone(self.project)
+        self.receiver.reset_mock()
+
+        self.start_milestone(self.project, title='Framing')
+
+        self.receiver.assert_not_called()
+
+
+class MilestoneCounterTests(ProjectTestCase):
+    def setUp(self):
+        super().setUp()
+        self.mute_notifications()
+
+    def add_milestone(self, project=None, **kwargs):
+        kwargs.setdefault('title', 'Foundations')
+        kwargs.setdefault('planned_end_date', timezone.now().date() + datetime.timedelta(days=30))
+        return ProjectMilestone.objects.create(
+            project=project or self.project, created_by=self.manager, **kwargs
+        )
+
+    def assert_counters(self, project, total, completed):
+        project.refresh_from_db(fields=['milestones_total', 'milestones_completed'])
+        self.assertEqual((project.milestones_total, project.milestones_completed), (total, completed))
+
+    def test_create_counts_milestones(self):
+        self.add_milestone()
+        self.add_milestone(title='Roofing', status=MilestoneStatus.COMPLETED)
+
+        self.assert_counters(self.project, total=2, completed=1)
+        self.assertEqual(self.project.progress_percentage, 50)
+
+    def test_status_change_moves_completed_count(self):
+        milestone = self.add_milestone()
+
+        milestone.status = MilestoneStatus.COMPLETED
+        milestone.save()
+        self.assert_counters(self.project, total=1, completed=1)
+
+        milestone.status = MilestoneStatus.ON_HOLD
+        milestone.save()
+        self.assert_counters(self.project, total=1, completed=0)
+
+    def test_moving_milestone_between_projects(self):
+        other = self.create_project(title='Annex build')
+        milestone = self.add_milestone(status=MilestoneStatus.COMPLETED)
+
+        milestone.project = other
+        milestone.save()
+
+        self.assert_counters(self.project, total=0, completed=0)
+        self.assert_counters(other, total=1, completed=1)
+
+    def test_saving_loaded_milestone_does_not_reselect_it(self):
+        milestone = ProjectMilestone.objects.get(pk=self.add_milestone().pk)
+        milestone.status = MilestoneStatus.COMPLETED
+
+        with CaptureQueriesContext(connection) as queries:
+            milestone.save()
+
+        table = f'FROM "{ProjectMilestone._meta.db_table}"'
+        self.assertEqual(
+            [query['sql'] for query in queries.captured_queries
+             if query['sql'].startswith('SELECT') and table in query['sql']],
+            [],
+        )
+        self.assert_counters(self.project, total=1, completed=1)
+
+        # The snapshot follows the save, so a later move is still counted.
+        other = self.create_project(title='Annex build')
+        milestone.project = other
+        milestone.save()
+        self.assert_counters(self.project, total=0, completed=0)
+        self.assert_counters(other, total=1, completed=1)
+
+    def test_delete_uncounts_milestone(self):
+        self.add_milestone()
+        completed = self.add_milestone(title='Roofing', status=MilestoneStatus.COMPLETED)
+
+        completed.delete()
+
+        self.assert_counters(self.project, total=1, completed=0)
+
+    def test_completing_project_counts_closed_milestones(self):
+        self.add_milestone()
+        self.add_milestone(title='Roofing', status=MilestoneStatus.COMPLETED)
+
+        project = Project.objects.get(pk=self.project.pk)
+        project.status = ProjectStatus.COMPLETED
+        project.save()
+
+        self.assertEqual(project.milestones_completed, 2)
+        self.assert_counters(self.project, total=2, completed=2)
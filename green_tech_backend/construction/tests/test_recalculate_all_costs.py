@@ -0,0 +1,79 @@
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from construction.ghana.models import EcoFeature, GhanaPricing, GhanaRegion
+from construction.models import ConstructionRequest, ConstructionRequestEcoFeature
+
+User = get_user_model()
+
+
+class RecalculateAllCostsCommandTests(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(email='client@example.com', password='testpass')
+        region = GhanaRegion.objects.create(
+            name=GhanaRegion.RegionName.GREATER_ACCRA,
+            capital='Accra',
+            cost_multiplier=Decimal('1.20'),
+        )
+        self.solar = EcoFeature.objects.create(name='Rooftop solar', category=EcoFeature.FeatureCategory.SOLAR)
+        self.water = EcoFeature.objects.create(name='Rainwater tank', category=EcoFeature.FeatureCategory.WATER)
+        self.pricing = GhanaPricing.objects.create(region=region, eco_feature=self.solar, base_price=Decimal('1000.00'))
+        GhanaPricing.objects.create(region=region, eco_feature=self.water, base_price=Decimal('250.00'))
+
+        self.priced_request = ConstructionRequest.objects.create(
+            title='Eco villa',
+            client=user,
+            region=GhanaRegion.RegionName.GREATER_ACCRA,
+            budget=Decimal('50000.00'),
+        )
+        self.unknown_region_request = ConstructionRequest.objects.create(
+            title='Lodge',
+            client=user,
+            region='Atlantis',
+            budget=Decimal('10000.00'),
+            estimated_cost=Decimal('12345.00'),
+        )
+        for construction_request in (self.priced_request, self.unknown_region_request):
+            ConstructionRequestEcoFeature.objects.create(
+                construction_request=construction_request, eco_feature=self.solar, quantity=2
+            )
+        ConstructionRequestEcoFeature.objects.create(
+            construction_request=self.priced_request, eco_feature=self.water, quantity=1
+        )
+
+    def recalculate(self):
+        out = StringIO()
+        call_command('recalculate_all_costs', stdout=out)
+        return out.getvalue()
+
+    def test_reprices_selections_and_estimates(self):
+        self.pricing.base_price = Decimal('1500.00')
+        self.pricing.save()
+
+        self.recalculate()
+
+        self.priced_request.refresh_from_db()
+        # 50000 budget + 2 x 1500 x 1.20 + 250 x 1.20.
+        self.assertEqual(self.priced_request.estimated_cost, Decimal('53900.00'))
+        solar = self.priced_request.selected_eco_features.get(eco_feature=self.solar)
+        self.assertEqual(solar.estimated_cost, Decimal('3600.00'))
+
+    def test_unknown_region_keeps_estimate(self):
+        self.recalculate()
+
+        self.unknown_region_request.refresh_from_db()
+        self.assertEqual(self.unknown_region_request.estimated_cost, Decimal('12345.00'))
+        selection = self.unknown_region_request.selected_eco_features.get()
+        self.assertIsNone(selection.estimated_cost)
+
+    def test_second_run_changes_nothing(self):
+        self.recalculate()
+
+        output = self.recalculate()
+
+        self.assertIn('0 eco-feature selections re-priced', output)
+        self.assertIn('0 construction request estimates updated', output)
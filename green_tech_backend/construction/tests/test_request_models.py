@@ -0,0 +1,43 @@
+from decimal import Decimal
+
+import pytest
+from django.contrib.auth import get_user_model
+
+from construction.ghana.models import GhanaRegion
+from construction.models import ConstructionRequest
+
+User = get_user_model()
+
+
+@pytest.fixture()
+def client_user(db):
+    return User.objects.create_user(email='client@example.com', password='testpass')
+
+
+@pytest.fixture()
+def accra(db) -> GhanaRegion:
+    return GhanaRegion.objects.create(
+        name=GhanaRegion.RegionName.GREATER_ACCRA,
+        capital='Accra',
+        cost_multiplier=Decimal('1.20'),
+    )
+
+
+@pytest.mark.django_db()
+def test_ghana_region_resolves_request_region(client_user, accra):
+    request = ConstructionRequest.objects.create(
+        title='Solar bungalow',
+        client=client_user,
+        region=GhanaRegion.RegionName.GREATER_ACCRA,
+    )
+
+    assert request.ghana_region == accra
+
+
+@pytest.mark.django_db()
+def test_ghana_region_follows_region_changes(client_user, accra):
+    request = ConstructionRequest.objects.create(title='Solar bungalow', client=client_user)
+    assert request.ghana_region is None
+
+    request.region = GhanaRegion.RegionName.GREATER_ACCRA
+    assert request.ghana_region == accra
@@ -0,0 +1,87 @@
+import shutil
+import tempfile
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from construction.document_generator import specification_cache_key
+from construction.models import ConstructionDocument, ConstructionRequest
+from construction.tasks import render_spec_pdf
+
+User = get_user_model()
+
+PDF_BYTES = b'%PDF-1.4 specification'
+
+
+class SpecificationApiTests(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        media = override_settings(MEDIA_ROOT=self.media_root)
+        media.enable()
+        self.addCleanup(media.disable)
+        cache.clear()
+
+        self.user = User.objects.create_user(email='client@example.com', password='testpass')
+        self.construction_request = ConstructionRequest.objects.create(title='Eco villa', client=self.user)
+        self.api_client = APIClient()
+        self.api_client.force_authenticate(self.user)
+        base = f'/api/construction/construction-requests/{self.construction_request.pk}'
+        self.generate_url = f'{base}/generate_specification/'
+        self.download_url = f'{base}/specification/'
+
+    def _body(self, response):
+        if response.streaming:
+            return b''.join(response.streaming_content)
+        return response.content
+
+    def test_download_before_render_is_404(self):
+        response = self.api_client.get(self.download_url)
+        self.assertEqual(response.status_code, 404)
+
+    def test_download_serves_cached_pdf(self):
+        cache.set(specification_cache_key(self.construction_request), PDF_BYTES)
+
+        response = self.api_client.get(self.download_url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/pdf')
+        self.assertEqual(int(response['Content-Length']), len(PDF_BYTES))
+        self.assertEqual(self._body(response), PDF_BYTES)
+
+    def test_download_falls_back_to_stored_document(self):
+        document = ConstructionDocument(
+            construction_request=self.construction_request,
+            title=f'Specification - {self.construction_request.title}',
+        )
+        document.file.save('spec.pdf', ContentFile(PDF_BYTES))
+
+        response = self.api_client.get(self.download_url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('attachment', response['Content-Disposition'])
+        self.assertEqual(self._body(response), PDF_BYTES)
+
+    def test_generate_returns_pdf_synchronously_by_default(self):
+        with mock.patch(
+            'construction.document_generator.render_specification_pdf', return_value=PDF_BYTES
+        ):
+            response = self.api_client.post(self.generate_url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._body(response), PDF_BYTES)
+        self.assertTrue(
+            self.construction_request.documents.filter(title__startswith='Specification - ').exists()
+        )
+
+    def test_generate_async_queues_render(self):
+        with mock.patch.object(render_spec_pdf, 'delay', return_value=mock.Mock(id='task-1')) as delay:
+            response = self.api_client.post(f'{self.generate_url}?async=1')
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.json(), {'task_id': 'task-1', 'status': 'queued'})
+        delay.assert_called_once_with(self.construction_request.pk)
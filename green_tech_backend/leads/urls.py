@@ -1,8 +1,8 @@
-from rest_framework.routers import DefaultRouter
+from rest_framework.routers import SimpleRouter
 
 from .views import LeadViewSet
 
-router = DefaultRouter()
+router = SimpleRouter()
 router.register('leads', LeadViewSet, basename='lead')
 
 urlpatterns = router.urls
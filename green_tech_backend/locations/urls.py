@@ -1,11 +1,11 @@
 from django.urls import include, path
-from rest_framework.routers import DefaultRouter
+from rest_framework.routers import SimpleRouter
 
 from .views_admin import RegionAdminViewSet
 
 app_name = 'locations'
 
-router = DefaultRouter()
+router = SimpleRouter()
 router.register('admin/regions', RegionAdminViewSet, basename='admin-regions')
 
 urlpatterns = [
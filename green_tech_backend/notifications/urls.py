@@ -1,10 +1,10 @@
 """URLs for the notifications API."""
 from django.urls import path, include
-from rest_framework.routers import DefaultRouter
+from rest_framework.routers import SimpleRouter
 
 from . import views
 
-router = DefaultRouter()
+router = SimpleRouter()
 router.register(r'admin/notifications/templates', views.NotificationTemplateViewSet, basename='notification-template')
 router.register(r'send', views.SendNotificationViewSet, basename='send-notification')
 router.register(r'triggers', views.NotificationTriggerViewSet, basename='notification-trigger')
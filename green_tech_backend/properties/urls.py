@@ -1,12 +1,12 @@
 from django.urls import include, path
-from rest_framework.routers import DefaultRouter
+from rest_framework.routers import SimpleRouter
 
 from .views import PropertyInquiryView, PropertyViewSet, ViewingAppointmentViewSet
 from .views_admin import PropertyAdminViewSet
 
 app_name = 'properties'
 
-router = DefaultRouter()
+router = SimpleRouter()
 router.register('properties', PropertyViewSet, basename='property')
 router.register('appointments', ViewingAppointmentViewSet, basename='appointments')
 router.register('admin/properties', PropertyAdminViewSet, basename='admin-properties')
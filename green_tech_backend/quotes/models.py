@@ -175,6 +175,16 @@ class Quote(models.Model):
             )
         ]
 
+    # Columns written by recalculate_totals().
+    TOTAL_FIELDS = (
+        'subtotal_amount',
+        'allowance_amount',
+        'adjustment_amount',
+        'tax_amount',
+        'discount_amount',
+        'total_amount',
+    )
+
     def __str__(self) -> str:  # pragma: no cover - trivial
         return f"Quote {self.reference}"
 
@@ -207,16 +217,23 @@ class Quote(models.Model):
             if not self.recipient_name and hasattr(self.construction_request, 'client'):
                 self.recipient_name = f"{self.construction_request.client.first_name} {self.construction_request.client.last_name}".strip()
         
-        # Set currency and multiplier from region
+        self.apply_region_defaults()
+        
+        if not self.valid_until:
+            self.valid_until = timezone.now() + timezone.timedelta(days=30)
+        super().save(*args, **kwargs)
+
+    def apply_region_defaults(self) -> None:
+        """Fill in currency and a neutral (1.00) multiplier from the region.
+
+        Callers that price items before saving run this first, so the totals
+        use the multiplier that save() will store.
+        """
         if self.region_id:
             if not self.currency_code:
                 self.currency_code = getattr(self.region, 'currency_code', 'USD')
             if not self.regional_multiplier or self.regional_multiplier == Decimal('1.00'):
                 self.regional_multiplier = getattr(self.region, 'cost_multiplier', Decimal('1.00'))
-        
-        if not self.valid_until:
-            self.valid_until = timezone.now() + timezone.timedelta(days=30)
-        super().save(*args, **kwargs)
 
     def recalculate_totals(self, items: Iterable['QuoteLineItem'] | None = None, commit: bool = True) -> Decimal:
         """Aggregate totals from items and persist them on the quote."""
@@ -228,11 +245,12 @@ class Quote(models.Model):
         tax_total = Decimal('0.00')
         discount_total = Decimal('0.00')
 
+        stale_items = []
         for item in items:
             total = item.compute_total(self.regional_multiplier)
             if item.calculated_total != total:
                 item.calculated_total = total
-                item.save(update_fields=('calculated_total',))
+                stale_items.append(item)
             
             if item.kind == QuoteLineItemKind.ALLOWANCE:
                 allowances += total
@@ -247,6 +265,10 @@ class Quote(models.Model):
             if 'discount_amount' in item.metadata:
                 discount_total += Decimal(str(item.metadata['discount_amount']))
 
+        if stale_items:
+            # One batched UPDATE instead of a save() per changed line item.
+            QuoteLineItem.objects.bulk_update(stale_items, ['calculated_total'])
+
         self.subtotal_amount = quantize(subtotal)
         self.allowance_amount = quantize(allowances)
         self.adjustment_amount = quantize(adjustments)
@@ -255,25 +277,21 @@ class Quote(models.Model):
         self.total_amount = quantize(subtotal + allowances + adjustments + tax_total - discount_total)
         
         if commit:
-            self.save(update_fields=(
-                'subtotal_amount',
-                'allowance_amount',
-                'adjustment_amount',
-                'tax_amount',
-                'discount_amount',
-                'total_amount',
-                'updated_at',
-            ))
+            self.save(update_fields=(*self.TOTAL_FIELDS, 'updated_at'))
         return self.total_amount
 
-    def mark_sent(self):
-        """Transition quote to the *sent* state and timestamp it."""
+    def mark_sent(self, extra_fields: Iterable[str] = ()):
+        """Transition quote to the *sent* state and timestamp it.
+
+        ``extra_fields`` lets callers persist other pending changes (such as
+        totals from ``recalculate_totals(commit=False)``) in the same UPDATE.
+        """
 
         now = timezone.now()
         self.status = QuoteStatus.SENT
         self.sent_at = now
         self.updated_at = now
-        self.save(update_fields=('status', 'sent_at', 'updated_at'))
+        self.save(update_fields=('status', 'sent_at', 'updated_at', *extra_fields))
 
     def mark_viewed(self):
         """Record customer view; transition to viewed when applicable."""
@@ -402,21 +420,24 @@ class Quote(models.Model):
         )
         new_quote.save()
         
-        # Copy line items
-        for item in self.items.all():
-            QuoteLineItem.objects.create(
+        # Copy line items in one batched INSERT
+        items = QuoteLineItem.objects.bulk_create(
+            QuoteLineItem(
                 quote=new_quote,
                 kind=item.kind,
                 label=item.label,
                 quantity=item.quantity,
                 unit_cost=item.unit_cost,
                 apply_region_multiplier=item.apply_region_multiplier,
+                calculated_total=item.compute_total(new_quote.regional_multiplier),
                 position=item.position,
                 metadata=item.metadata.copy() if item.metadata else {}
             )
+            for item in self.items.all()
+        )
         
         # Recalculate totals for new quote
-        new_quote.recalculate_totals()
+        new_quote.recalculate_totals(items=items)
         
         return new_quote
 
@@ -9,17 +9,22 @@ from .serializers import QuoteMessageSerializer
 GROUP_TEMPLATE = 'quote-chat-{quote_id}'
 
 
-def broadcast_quote_message(message) -> None:
-    """Send a new quote chat message payload to connected WebSocket clients."""
+def broadcast_quote_message(message, payload: dict | None = None) -> None:
+    """Send a new quote chat message payload to connected WebSocket clients.
+
+    Callers that have already serialized ``message`` can pass ``payload`` to
+    skip a second serialization.
+    """
 
     layer = get_channel_layer()
     if not layer:
         return
-    serializer = QuoteMessageSerializer(message, context={'request': None})
+    if payload is None:
+        payload = QuoteMessageSerializer(message, context={'request': None}).data
     async_to_sync(layer.group_send)(
         GROUP_TEMPLATE.format(quote_id=message.quote_id),
         {
             'type': 'chat.message',
-            'payload': serializer.data,
+            'payload': payload,
         },
     )
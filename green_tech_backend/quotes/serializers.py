@@ -108,7 +108,7 @@ class QuoteListSerializer(serializers.ModelSerializer):
 
 
 class QuoteDetailSerializer(QuoteListSerializer):
-    items = QuoteLineItemSerializer(many=True, read_only=True)
+    items = serializers.SerializerMethodField()
     notes = serializers.CharField(read_only=True)
     terms = serializers.CharField(read_only=True)
     document_html = serializers.SerializerMethodField()
@@ -127,6 +127,12 @@ class QuoteDetailSerializer(QuoteListSerializer):
             'timeline',
         )
 
+    def get_items(self, obj: Quote) -> list[dict[str, object]]:
+        # Line item fields map 1:1 to columns, so project them straight from
+        # the (prefetched) rows instead of binding a nested serializer per item.
+        fields = QuoteLineItemSerializer.Meta.fields
+        return [{field: getattr(item, field) for field in fields} for item in obj.items.all()]
+
     def get_document_html(self, obj: Quote) -> str:
         return obj.render_document()
 
@@ -197,6 +203,8 @@ class QuoteWriteSerializer(serializers.ModelSerializer):
 
         if not quote.currency_code:
             quote.currency_code = region.currency_code
+        # Items are priced before save(), so apply its multiplier default now.
+        quote.apply_region_defaults()
 
     def create(self, validated_data):
         items_data = validated_data.pop('items', [])
@@ -206,8 +214,8 @@ class QuoteWriteSerializer(serializers.ModelSerializer):
             quote.region = region
         self._ensure_region_defaults(quote)
         quote.save()
-        self._replace_items(quote, items_data)
-        quote.recalculate_totals()
+        items = self._replace_items(quote, items_data)
+        quote.recalculate_totals(items=items)
         return quote
 
     def update(self, instance: Quote, validated_data):
@@ -219,25 +227,31 @@ class QuoteWriteSerializer(serializers.ModelSerializer):
         if region is not None:
             instance.region = region
         self._ensure_region_defaults(instance)
+        # Totals are folded into the single save below rather than written by
+        # a second UPDATE; freshly created items are reused instead of re-read.
+        items = self._replace_items(instance, items_data) if items_data is not None else None
+        instance.recalculate_totals(items=items, commit=False)
         instance.save()
-        if items_data is not None:
-            self._replace_items(instance, items_data)
-        instance.recalculate_totals()
         return instance
 
-    def _replace_items(self, quote: Quote, items_data: list[dict[str, object]]):
+    def _replace_items(self, quote: Quote, items_data: list[dict[str, object]]) -> list[QuoteLineItem]:
         quote.items.all().delete()
+        items = []
         for idx, payload in enumerate(items_data):
             payload = dict(payload)
             payload.pop('id', None)
             payload.pop('calculated_total', None)
             metadata = payload.pop('metadata', {}) or {}
-            QuoteLineItem.objects.create(
+            item = QuoteLineItem(
                 quote=quote,
-                position=payload.get('position', idx),
+                position=payload.pop('position', idx),
                 metadata=metadata,
                 **payload,
             )
+            # Set up front so recalculate_totals has nothing left to rewrite.
+            item.calculated_total = item.compute_total(quote.regional_multiplier)
+            items.append(item)
+        return QuoteLineItem.objects.bulk_create(items)
 
 
 class QuoteActionSerializer(serializers.Serializer):
@@ -1,4 +1,5 @@
 from decimal import Decimal
+from unittest.mock import patch
 
 import pytest
 from rest_framework.test import APIClient
@@ -7,6 +8,7 @@ from locations.models import Region
 from plans.models import Plan, PlanStyle, BuildRequest
 from leads.models import Lead, LeadSource, LeadStatus
 from leads.services import sync_lead_from_build_request
+from quotes.models import Quote, QuoteStatus
 
 
 @pytest.fixture()
@@ -87,7 +89,9 @@ def _create_quote(api_client: APIClient, request: BuildRequest) -> dict:
 
 
 @pytest.mark.django_db()
-def test_quote_lifecycle(api_client: APIClient, build_request: BuildRequest):
+def test_quote_lifecycle(
+    api_client: APIClient, build_request: BuildRequest, django_capture_on_commit_callbacks
+):
     data = _create_quote(api_client, build_request)
 
     assert data['status'] == 'draft'
@@ -106,11 +110,13 @@ def test_quote_lifecycle(api_client: APIClient, build_request: BuildRequest):
     assert view_response.status_code == 200
     assert view_response.json()['status'] == 'viewed'
 
-    accept_response = api_client.post(
-        f'/api/quotes/{quote_id}/accept/',
-        {'signature_name': 'Jane Customer', 'signature_email': 'jane@example.com'},
-        format='json',
-    )
+    # Lead syncing and notifications run once the transition commits.
+    with django_capture_on_commit_callbacks(execute=True):
+        accept_response = api_client.post(
+            f'/api/quotes/{quote_id}/accept/',
+            {'signature_name': 'Jane Customer', 'signature_email': 'jane@example.com'},
+            format='json',
+        )
     assert accept_response.status_code == 200
     detail = accept_response.json()
     assert detail['status'] == 'accepted'
@@ -131,3 +137,128 @@ def test_quote_list_filters_by_customer_email(api_client: APIClient, build_reque
     payload = response.json()
     assert payload['count'] == 1
     assert payload['results'][0]['reference'] == record['reference']
+
+
+@pytest.mark.django_db()
+@pytest.mark.parametrize(
+    ('action', 'event'), [('send', 'sent'), ('accept', 'accepted'), ('decline', 'declined')]
+)
+def test_quote_transition_events_fire_after_commit(
+    api_client: APIClient,
+    build_request: BuildRequest,
+    django_capture_on_commit_callbacks,
+    action: str,
+    event: str,
+):
+    record = _create_quote(api_client, build_request)
+
+    with patch('quotes.views.handle_quote_event') as handle_event:
+        with django_capture_on_commit_callbacks() as callbacks:
+            response = api_client.post(
+                f"/api/quotes/{record['id']}/{action}/",
+                {'signature_name': 'Jane Customer'},
+                format='json',
+            )
+            assert response.status_code == 200
+            handle_event.assert_not_called()
+
+        assert len(callbacks) == 1
+        callbacks[0]()
+
+    quote, fired_event = handle_event.call_args.args
+    assert str(quote.pk) == str(record['id'])
+    assert fired_event == event
+
+
+def _persisted_totals(quote_id) -> dict:
+    quote = Quote.objects.get(pk=quote_id)
+    return {field: getattr(quote, field) for field in Quote.TOTAL_FIELDS}
+
+
+@pytest.mark.django_db()
+def test_quote_update_replaces_items_and_totals(api_client: APIClient, build_request: BuildRequest):
+    record = _create_quote(api_client, build_request)
+
+    # A 1.00 multiplier falls back to the region's, and items are priced with it.
+    response = api_client.patch(
+        f"/api/quotes/{record['id']}/",
+        {
+            'regional_multiplier': '1.00',
+            'items': [
+                {
+                    'kind': 'base',
+                    'label': 'Base construction',
+                    'quantity': '2',
+                    'unit_cost': '1000.00',
+                    'apply_region_multiplier': True,
+                },
+                {
+                    'kind': 'allowance',
+                    'label': 'Landscaping allowance',
+                    'quantity': '1',
+                    'unit_cost': '300.00',
+                    'apply_region_multiplier': False,
+                },
+            ],
+        },
+        format='json',
+    )
+
+    assert response.status_code == 200, response.content
+    totals = _persisted_totals(record['id'])
+    assert totals['subtotal_amount'] == Decimal('2400.00')
+    assert totals['allowance_amount'] == Decimal('300.00')
+    assert totals['adjustment_amount'] == Decimal('0.00')
+    assert totals['total_amount'] == Decimal('2700.00')
+    assert pytest.approx(response.json()['total_amount']) == 2700.0
+    quote = Quote.objects.get(pk=record['id'])
+    assert quote.regional_multiplier == Decimal('1.20')
+    assert [item.calculated_total for item in quote.items.order_by('position')] == [
+        Decimal('2400.00'),
+        Decimal('300.00'),
+    ]
+
+
+@pytest.mark.django_db()
+def test_quote_update_without_items_reprices_existing_items(
+    api_client: APIClient, build_request: BuildRequest
+):
+    record = _create_quote(api_client, build_request)
+
+    response = api_client.patch(
+        f"/api/quotes/{record['id']}/", {'regional_multiplier': '1.10'}, format='json'
+    )
+
+    assert response.status_code == 200, response.content
+    totals = _persisted_totals(record['id'])
+    assert totals['subtotal_amount'] == Decimal('110000.00')
+    assert totals['total_amount'] == Decimal('113000.00')
+    base_item = Quote.objects.get(pk=record['id']).items.get(kind='base')
+    assert base_item.calculated_total == Decimal('110000.00')
+
+
+@pytest.mark.django_db()
+def test_send_persists_totals_with_status(api_client: APIClient, build_request: BuildRequest):
+    record = _create_quote(api_client, build_request)
+    Quote.objects.filter(pk=record['id']).update(total_amount=Decimal('0.00'))
+
+    response = api_client.post(f"/api/quotes/{record['id']}/send/")
+
+    assert response.status_code == 200
+    quote = Quote.objects.get(pk=record['id'])
+    assert quote.status == QuoteStatus.SENT
+    assert quote.total_amount == Decimal('123000.00')
+
+
+@pytest.mark.django_db()
+def test_quote_revision_copies_items_and_totals(api_client: APIClient, build_request: BuildRequest):
+    record = _create_quote(api_client, build_request)
+    api_client.post(f"/api/quotes/{record['id']}/send/")
+    original = Quote.objects.get(pk=record['id'])
+
+    revision = original.create_revision(changed_by=None, change_reason='Price update')
+
+    assert _persisted_totals(revision.pk) == _persisted_totals(original.pk)
+    assert list(
+        revision.items.order_by('position').values_list('label', 'calculated_total')
+    ) == list(original.items.order_by('position').values_list('label', 'calculated_total'))
@@ -1,9 +1,9 @@
-from rest_framework.routers import DefaultRouter
+from rest_framework.routers import SimpleRouter
 
 from .views import QuoteMessageViewSet, QuoteViewSet
 
 
-router = DefaultRouter()
+router = SimpleRouter()
 router.register('quotes', QuoteViewSet, basename='quote')
 router.register(r'quotes/(?P<quote_pk>[^/.]+)/messages', QuoteMessageViewSet, basename='quote-message')
 
@@ -1,4 +1,8 @@
 from __future__ import annotations
+from functools import partial
+
+from django.db import transaction
+from django.db.models import Prefetch
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 
@@ -7,7 +11,7 @@ from rest_framework.decorators import action
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 
-from .models import Quote, QuoteChatMessage, QuoteMessageReceipt, QuoteStatus
+from .models import Quote, QuoteChatMessage, QuoteLineItem, QuoteMessageReceipt, QuoteStatus
 from .permissions import QuoteChatAccessPermission
 from .notifications import notify_quote_chat_message
 from .realtime import broadcast_quote_message
@@ -26,7 +30,11 @@ class QuoteViewSet(viewsets.ModelViewSet):
     http_method_names = ['get', 'post', 'patch', 'put']
     queryset = Quote.objects.select_related(
         'build_request__plan', 'build_request__region', 'region'
-    ).prefetch_related('items')
+    )
+    # Actions that render the detail payload (line items, document HTML) or
+    # recalculate totals from unchanged items. List payloads never touch items,
+    # and updates replace them, so a prefetched cache there would go stale.
+    item_actions = frozenset({'retrieve', 'send', 'mark_viewed', 'accept', 'decline'})
 
     def get_serializer_class(self):
         if self.action in {'create', 'update', 'partial_update'}:
@@ -37,6 +45,10 @@ class QuoteViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         queryset = super().get_queryset()
+        if self.action in self.item_actions:
+            queryset = queryset.prefetch_related(
+                Prefetch('items', queryset=QuoteLineItem.objects.order_by('position', 'created_at'))
+            )
         request = self.request
         status_param = request.query_params.get('status')
         build_request = request.query_params.get('build_request')
@@ -68,17 +80,33 @@ class QuoteViewSet(viewsets.ModelViewSet):
         detail = QuoteDetailSerializer(quote, context=self.get_serializer_context())
         return Response(detail.data)
 
+    def _locked_quote(self) -> Quote:
+        """Fetch the quote with its row locked until the surrounding transaction ends.
+
+        Status-guarded transitions lock the row so concurrent requests serialise
+        on it instead of both passing the status check. Only the check and the
+        write run under the lock; transitions defer handle_quote_event to
+        transaction.on_commit so lead syncing and notifications run after the
+        row is released, and never for a rolled-back transition.
+        """
+        queryset = self.filter_queryset(self.get_queryset()).select_for_update(of=('self',))
+        quote = get_object_or_404(queryset, pk=self.kwargs['pk'])
+        self.check_object_permissions(self.request, quote)
+        return quote
+
     @action(detail=True, methods=['post'])
     def send(self, request, pk=None):
-        quote = self.get_object()
-        if quote.status in {QuoteStatus.ACCEPTED, QuoteStatus.DECLINED}:
-            return Response(
-                {'detail': 'Accepted or declined quotes cannot be re-sent.'},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-        quote.recalculate_totals()
-        quote.mark_sent()
-        handle_quote_event(quote, 'sent')
+        with transaction.atomic():
+            quote = self._locked_quote()
+            if quote.status in {QuoteStatus.ACCEPTED, QuoteStatus.DECLINED}:
+                return Response(
+                    {'detail': 'Accepted or declined quotes cannot be re-sent.'},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            # Totals and the status change go out in a single UPDATE.
+            quote.recalculate_totals(commit=False)
+            quote.mark_sent(extra_fields=Quote.TOTAL_FIELDS)
+            transaction.on_commit(partial(handle_quote_event, quote, 'sent'))
         return Response(QuoteDetailSerializer(quote, context=self.get_serializer_context()).data)
 
     @action(detail=True, methods=['post'], url_path='view')
@@ -90,32 +118,34 @@ class QuoteViewSet(viewsets.ModelViewSet):
 
     @action(detail=True, methods=['post'])
     def accept(self, request, pk=None):
-        quote = self.get_object()
-        if quote.status == QuoteStatus.ACCEPTED:
-            return Response(
-                {'detail': 'Quote already accepted.'},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
         serializer = QuoteActionSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        signature_name = serializer.validated_data.get('signature_name') or quote.recipient_name
-        signature_email = serializer.validated_data.get('signature_email') or quote.recipient_email
-        if not signature_name:
-            return Response({'detail': 'Signature name required.'}, status=status.HTTP_400_BAD_REQUEST)
-        quote.mark_accepted(signature_name, signature_email)
-        handle_quote_event(quote, 'accepted')
+        with transaction.atomic():
+            quote = self._locked_quote()
+            if quote.status == QuoteStatus.ACCEPTED:
+                return Response(
+                    {'detail': 'Quote already accepted.'},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            signature_name = serializer.validated_data.get('signature_name') or quote.recipient_name
+            signature_email = serializer.validated_data.get('signature_email') or quote.recipient_email
+            if not signature_name:
+                return Response({'detail': 'Signature name required.'}, status=status.HTTP_400_BAD_REQUEST)
+            quote.mark_accepted(signature_name, signature_email)
+            transaction.on_commit(partial(handle_quote_event, quote, 'accepted'))
         return Response(QuoteDetailSerializer(quote, context=self.get_serializer_context()).data)
 
     @action(detail=True, methods=['post'])
     def decline(self, request, pk=None):
-        quote = self.get_object()
-        if quote.status == QuoteStatus.ACCEPTED:
-            return Response(
-                {'detail': 'Accepted quotes cannot be declined.'},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-        quote.mark_declined()
-        handle_quote_event(quote, 'declined')
+        with transaction.atomic():
+            quote = self._locked_quote()
+            if quote.status == QuoteStatus.ACCEPTED:
+                return Response(
+                    {'detail': 'Accepted quotes cannot be declined.'},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            quote.mark_declined()
+            transaction.on_commit(partial(handle_quote_event, quote, 'declined'))
         return Response(QuoteDetailSerializer(quote, context=self.get_serializer_context()).data)
 
 
@@ -130,10 +160,13 @@ class QuoteMessageViewSet(
     permission_classes = (IsAuthenticated, QuoteChatAccessPermission)
 
     def _quote_queryset(self):
-        return Quote.objects.select_related('build_request__user')
+        # The access check only compares build_request.user_id and contact emails.
+        return Quote.objects.select_related('build_request')
 
     def _message_queryset(self):
-        return QuoteChatMessage.objects.select_related('quote', 'sender').prefetch_related(
+        # Messages are always scoped to the quote cached by get_quote(), and the
+        # serializer only emits quote_id, so the quote row isn't joined again.
+        return QuoteChatMessage.objects.select_related('sender').prefetch_related(
             'attachments',
             'receipts__user',
         )
@@ -158,8 +191,6 @@ class QuoteMessageViewSet(
             user=user,
             defaults={'read_at': timezone.now()},
         )
-        broadcast_quote_message(message)
-        notify_quote_chat_message(message)
         return message
 
     def create(self, request, *args, **kwargs):
@@ -167,6 +198,10 @@ class QuoteMessageViewSet(
         serializer.is_valid(raise_exception=True)
         message = self.perform_create(serializer)
         message = self._message_queryset().get(pk=message.pk)
+        message.quote = self.get_quote()
         output = self.get_serializer(message)
+        # Serialize once and reuse the payload for the WebSocket broadcast.
+        broadcast_quote_message(message, payload=output.data)
+        notify_quote_chat_message(message)
         headers = self.get_success_headers(output.data)
         return Response(output.data, status=status.HTTP_201_CREATED, headers=headers)